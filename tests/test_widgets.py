@@ -0,0 +1,33 @@
+import tkinter as tk
+
+import pytest
+
+ctk = pytest.importorskip("customtkinter")
+pytest.importorskip("markdown2")
+
+from ucan.widgets import MessagesContainer  # noqa: E402
+
+
+@pytest.fixture
+def root():
+    try:
+        window = ctk.CTk()
+    except tk.TclError:
+        pytest.skip("no display available")
+    yield window
+    window.destroy()
+
+
+def test_evicted_container_destroys_outer_frame(root):
+    container = MessagesContainer(root)
+    container.pack(fill="both", expand=True)
+    outer = container._parent_frame
+    commands = set(container._tclCommands)
+    root.update_idletasks()
+
+    container.destroy()
+
+    assert not outer.winfo_exists()
+    for sequence in root.tk.splitlist(root.tk.call("bind", "all")):
+        script = str(root.tk.call("bind", "all", sequence))
+        assert not any(command in script for command in commands)
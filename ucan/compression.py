@@ -1,3 +1,4 @@
+import functools
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, List
@@ -7,6 +8,12 @@ from transformers import pipeline
 logger = logging.getLogger("UCAN")
 
 
+@functools.lru_cache(maxsize=4096)
+def _parse_timestamp(value: str) -> datetime:
+    """Parse an ISO timestamp, memoized since history rows share timestamps"""
+    return datetime.fromisoformat(value)
+
+
 class MessageCompressor:
     def __init__(self, db):
         self.db = db
@@ -50,7 +57,7 @@ class MessageCompressor:
             recent_messages = [
                 msg
                 for msg in messages
-                if datetime.fromisoformat(msg["created_at"]) > recent_cutoff
+                if _parse_timestamp(msg["created_at"]) > recent_cutoff
             ]
 
             # Get summaries for older messages
@@ -84,7 +91,7 @@ class MessageCompressor:
         """Group messages by date"""
         groups = {}
         for msg in messages:
-            date = datetime.fromisoformat(msg["created_at"]).date()
+            date = _parse_timestamp(msg["created_at"]).date()
             if date not in groups:
                 groups[date] = []
             groups[date].append(msg)
@@ -1,12 +1,20 @@
 import datetime
 import logging
+import os
 import random
 import sqlite3
+import uuid
 from pathlib import Path
 from typing import List, Optional
 
 logger = logging.getLogger("UCAN")
 
+# Fixed SQL text so sqlite3's statement cache reuses the prepared statement
+_INSERT_CONTACT_MESSAGE = """
+    INSERT INTO messages (contact_id, sender, content, is_file)
+    VALUES (?, ?, ?, ?)
+"""
+
 
 class Database:
     def __init__(self):
@@ -20,6 +28,7 @@ class Database:
             self.db_path = data_dir / "chat.db"
             self.conn = sqlite3.connect(str(self.db_path))
             self.conn.row_factory = sqlite3.Row
+            self._configure_connection()
 
             # Create tables if they don't exist
             self._create_tables()
@@ -28,6 +37,17 @@ class Database:
             logger.error(f"Database initialization error: {str(e)}")
             raise
 
+    def _configure_connection(self):
+        """Tune the connection for a single-user, write-often chat database"""
+        # WAL keeps reads going during writes and syncs once per commit
+        # instead of twice; it persists in the file, the rest is per connection
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-64000")
+        self.conn.execute("PRAGMA mmap_size=268435456")
+        self.conn.execute("PRAGMA busy_timeout=5000")
+
     def _create_tables(self):
         """Create necessary database tables"""
         try:
@@ -133,10 +153,35 @@ class Database:
                     )
                 """)
 
+            self.ensure_indexes()
+
         except Exception as e:
             logger.error(f"Error creating tables: {str(e)}")
             raise
 
+    def ensure_indexes(self):
+        """Create lookup indexes for the columns present in the schema"""
+        try:
+            with self.conn:
+                message_columns = {
+                    row[1] for row in self.conn.execute("PRAGMA table_info(messages)")
+                }
+                for column in ("contact_id", "conversation_id", "project_id"):
+                    if column in message_columns:
+                        self.conn.execute(
+                            f"CREATE INDEX IF NOT EXISTS idx_messages_{column}_created "
+                            f"ON messages({column}, created_at)"
+                        )
+
+                if self.conn.execute("PRAGMA table_info(conversations)").fetchone():
+                    self.conn.execute(
+                        "CREATE INDEX IF NOT EXISTS idx_conversations_updated "
+                        "ON conversations(updated_at)"
+                    )
+
+        except Exception as e:
+            logger.error(f"Error creating indexes: {str(e)}")
+
     def create_project(self, project_data: dict):
         """Create a new project"""
         try:
@@ -279,7 +324,7 @@ class Database:
             return []
 
     def get_all_conversations(self):
-        """Get all standalone conversations"""
+        """Get all standalone conversations, newest first"""
         try:
             cursor = self.conn.cursor()
             cursor.execute("""
@@ -289,7 +334,7 @@ class Database:
                 FROM conversations c
                 LEFT JOIN messages m ON m.conversation_id = c.id
                 GROUP BY c.id
-                ORDER BY c.updated_at DESC
+                ORDER BY c.updated_at DESC, c.id DESC
             """)
             conversations = []
             for row in cursor.fetchall():
@@ -381,6 +426,48 @@ class Database:
             logger.error(f"Error adding message: {str(e)}")
             return None
 
+    def add_conversation_message(self, conversation_id: int, message: dict):
+        """Add a message and bump the conversation's updated_at in one commit"""
+        try:
+            created_at = message.get("created_at", datetime.datetime.now())
+            with self.conn:
+                cursor = self.conn.execute(
+                    """
+                    INSERT INTO messages (conversation_id, content, sender, created_at)
+                    VALUES (?, ?, ?, ?)
+                """,
+                    (conversation_id, message["content"], message["sender"], created_at),
+                )
+                self.conn.execute(
+                    "UPDATE conversations SET updated_at = ? WHERE id = ?",
+                    (created_at, conversation_id),
+                )
+            return cursor.lastrowid
+        except Exception as e:
+            logger.error(f"Error adding conversation message: {str(e)}")
+            return None
+
+    def add_project_message(self, project_id: int, message: dict):
+        """Add a message and bump the project's updated_at in one commit"""
+        try:
+            created_at = message.get("created_at", datetime.datetime.now())
+            with self.conn:
+                cursor = self.conn.execute(
+                    """
+                    INSERT INTO messages (project_id, content, sender, created_at)
+                    VALUES (?, ?, ?, ?)
+                """,
+                    (project_id, message["content"], message["sender"], created_at),
+                )
+                self.conn.execute(
+                    "UPDATE projects SET updated_at = ? WHERE id = ?",
+                    (created_at, project_id),
+                )
+            return cursor.lastrowid
+        except Exception as e:
+            logger.error(f"Error adding project message: {str(e)}")
+            return None
+
     def get_messages(self, conversation_id: int):
         """Get all messages from a conversation"""
         try:
@@ -437,22 +524,25 @@ class Database:
         self, sender: str, contact_name: str, content: str, is_file: bool = False
     ):
         """Save a message to the database"""
+        self.save_messages([(sender, contact_name, content, is_file)])
+
+    def save_messages(self, messages):
+        """Save (sender, contact_name, content, is_file) rows in one transaction"""
         try:
             with self.conn:
-                # Get or create contact
-                contact_id = self._get_or_create_contact(contact_name)
+                contact_ids = {}
+                rows = []
+                for sender, contact_name, content, is_file in messages:
+                    if contact_name not in contact_ids:
+                        contact_ids[contact_name] = self._get_or_create_contact(
+                            contact_name
+                        )
+                    rows.append((contact_ids[contact_name], sender, content, is_file))
 
-                # Insert message
-                self.conn.execute(
-                    """
-                    INSERT INTO messages (contact_id, sender, content, is_file)
-                    VALUES (?, ?, ?, ?)
-                """,
-                    (contact_id, sender, content, is_file),
-                )
+                self.conn.executemany(_INSERT_CONTACT_MESSAGE, rows)
 
         except Exception as e:
-            logger.error(f"Error saving message: {str(e)}")
+            logger.error(f"Error saving messages: {str(e)}")
 
     def get_messages(
         self, contact_name: str, limit: Optional[int] = None
@@ -464,12 +554,12 @@ class Database:
                 JOIN contacts c ON m.contact_id = c.id
                 WHERE c.name = ?
                 ORDER BY m.created_at ASC
+                LIMIT ?
             """
 
-            if limit:
-                query += f" LIMIT {limit}"
-
-            cursor = self.conn.execute(query, (contact_name,))
+            # LIMIT -1 is "no limit"; binding it keeps the SQL text constant
+            # so sqlite3's statement cache reuses the prepared statement
+            cursor = self.conn.execute(query, (contact_name, limit or -1))
             return [dict(row) for row in cursor.fetchall()]
 
         except Exception as e:
@@ -661,15 +751,12 @@ class Database:
                 FROM messages m
                 LEFT JOIN attachments a ON a.message_id = m.id
                 ORDER BY m.created_at DESC
+                LIMIT ? OFFSET ?
             """
 
-            if limit is not None:
-                query += f" LIMIT {limit}"
-
-            if offset is not None:
-                query += f" OFFSET {offset}"
-
-            cursor = self.conn.execute(query)
+            cursor = self.conn.execute(
+                query, (-1 if limit is None else limit, offset or 0)
+            )
             results = cursor.fetchall()
 
             messages = []
@@ -716,40 +803,58 @@ class Database:
             logger.error(f"Error saving project: {str(e)}")
             raise
 
+    def has_projects(self) -> bool:
+        """Check whether any project exists without loading them"""
+        try:
+            cursor = self.conn.execute("SELECT EXISTS(SELECT 1 FROM projects)")
+            return bool(cursor.fetchone()[0])
+        except Exception as e:
+            logger.error(f"Error checking projects: {str(e)}")
+            return False
+
     def get_all_projects(self) -> List[dict]:
-        """Get all projects"""
+        """Get all projects, newest first"""
         try:
             cursor = self.conn.execute(
                 """
                 SELECT * FROM projects
-                ORDER BY updated_at DESC
+                ORDER BY updated_at DESC, id DESC
             """
             )
             projects = [dict(row) for row in cursor.fetchall()]
-
-            # Get conversations and files for each project
+            by_id = {}
             for project in projects:
-                # Get conversations
+                project["conversations"] = []
+                project["files"] = []
+                by_id[project["id"]] = project
+
+            # Get conversations and files for all projects in one query each,
+            # instead of two queries per project
+            if by_id:
+                placeholders = ", ".join("?" * len(by_id))
+                project_ids = tuple(by_id)
+
                 cursor = self.conn.execute(
-                    """
+                    f"""
                     SELECT * FROM project_conversations
-                    WHERE project_id = ?
+                    WHERE project_id IN ({placeholders})
                     ORDER BY created_at ASC
                 """,
-                    (project["id"],),
+                    project_ids,
                 )
-                project["conversations"] = [dict(row) for row in cursor.fetchall()]
+                for row in cursor.fetchall():
+                    by_id[row["project_id"]]["conversations"].append(dict(row))
 
-                # Get files
                 cursor = self.conn.execute(
-                    """
+                    f"""
                     SELECT * FROM project_files
-                    WHERE project_id = ?
+                    WHERE project_id IN ({placeholders})
                     ORDER BY created_at ASC
                 """,
-                    (project["id"],),
+                    project_ids,
                 )
-                project["files"] = [dict(row) for row in cursor.fetchall()]
+                for row in cursor.fetchall():
+                    by_id[row["project_id"]]["files"].append(dict(row))
 
             return projects
 
@@ -885,25 +990,26 @@ class Database:
                     )
 
             # Create standalone messages with contacts
+            standalone_messages = []
             for i in range(1, 6):
                 contact_name = f"Contato {i}"
-                # Ensure contact exists
-                self._get_or_create_contact(contact_name)
-
-                # Add messages
-                self.save_message(
-                    "Você",
-                    contact_name,
-                    f"Olá, esta é uma mensagem de teste {i}",
-                    False,
+                standalone_messages.append(
+                    (
+                        "Você",
+                        contact_name,
+                        f"Olá, esta é uma mensagem de teste {i}",
+                        False,
+                    )
                 )
-
-                self.save_message(
-                    "Assistente",
-                    contact_name,
-                    f"Olá! Como posso ajudar com sua solicitação? Esta é uma resposta automática de teste {i}",
-                    False,
+                standalone_messages.append(
+                    (
+                        "Assistente",
+                        contact_name,
+                        f"Olá! Como posso ajudar com sua solicitação? Esta é uma resposta automática de teste {i}",
+                        False,
+                    )
                 )
+            self.save_messages(standalone_messages)
 
             # Create sample templates
             sample_templates = [
@@ -1048,26 +1154,24 @@ class Database:
                 ]
 
             # Insert messages with timestamps
-            for i, msg in enumerate(messages):
-                # Calculate timestamp with progressive delay
-                timestamp_offset = (
-                    f"-{random.randint(1, 5)} hours, -{5 * (len(messages) - i)} minutes"
-                )
-
-                cursor = self.conn.cursor()
-                cursor.execute(
-                    """
-                    INSERT INTO messages (project_id, conversation_id, sender, content, created_at)
-                    VALUES (?, ?, ?, ?, datetime('now', ?))
-                """,
+            cursor = self.conn.cursor()
+            cursor.executemany(
+                """
+                INSERT INTO messages (project_id, conversation_id, sender, content, created_at)
+                VALUES (?, ?, ?, ?, datetime('now', ?))
+            """,
+                [
                     (
                         project_id,
                         conversation_id,
                         msg["sender"],
                         msg["content"],
-                        timestamp_offset,
-                    ),
-                )
+                        # Calculate timestamp with progressive delay
+                        f"-{random.randint(1, 5)} hours, -{5 * (len(messages) - i)} minutes",
+                    )
+                    for i, msg in enumerate(messages)
+                ],
+            )
 
             # Update conversation with last message as preview
             if messages:
@@ -1150,8 +1254,6 @@ class Database:
                 },
             ]
 
-            import os
-
             app_dir = os.path.join(os.path.expanduser("~"), ".ucan", "files")
             os.makedirs(app_dir, exist_ok=True)
 
@@ -1165,8 +1267,6 @@ class Database:
                     )
 
                     # Create a mock filepath
-                    import uuid
-
                     unique_id = str(uuid.uuid4())
                     file_path = os.path.join(app_dir, f"{unique_id}_{file_name}")
 
@@ -1233,3 +1333,28 @@ class Database:
         except Exception as e:
             logger.error(f"Error adding message to project: {str(e)}")
             return None
+
+    def add_messages_to_project(self, project_id: int, messages: List[dict]) -> bool:
+        """Add several messages to a project in a single transaction"""
+        try:
+            now = datetime.datetime.now()
+            with self.conn:
+                self.conn.executemany(
+                    """
+                    INSERT INTO messages (project_id, content, sender, created_at)
+                    VALUES (?, ?, ?, ?)
+                """,
+                    [
+                        (
+                            project_id,
+                            message["content"],
+                            message["sender"],
+                            message.get("created_at", now),
+                        )
+                        for message in messages
+                    ],
+                )
+            return True
+        except Exception as e:
+            logger.error(f"Error adding messages to project: {str(e)}")
+            return False
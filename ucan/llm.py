@@ -1,9 +1,32 @@
 import base64
 import logging
+import random
 from typing import Dict, List, Optional
 
 logger = logging.getLogger("UCAN")
 
+# Respostas temporárias (mock) - Remover quando implementar a API real
+_MOCK_RESPONSES = (
+    "Entendi! Vou ajudar você com isso.",
+    "Interessante! Pode me contar mais?",
+    "Hmm, deixa eu pensar...",
+    "Que legal! Vamos explorar essa ideia.",
+    "Ótima pergunta! Vou tentar responder da melhor forma possível.",
+    "Isso é muito interessante! Vamos discutir mais sobre isso.",
+    "Entendo seu ponto de vista. Aqui está o que penso...",
+    "Que tal considerarmos uma abordagem diferente?",
+    "Vou pesquisar mais sobre isso e te dar uma resposta mais completa.",
+    "Excelente observação! Vamos analisar em detalhes.",
+)
+
+_MOCK_FILE_RESPONSES = (
+    "Analisando o arquivo... parece ser um {type} interessante!",
+    "Recebi seu arquivo! Vou dar uma olhada nesse {type}.",
+    "Legal! Vou processar esse {type} e te dar um feedback.",
+    "Ótimo! Vou analisar esse {type} e te ajudar com ele.",
+    "Arquivo recebido! Vou examinar esse {type} com atenção.",
+)
+
 
 class LLMProvider:
     """Provedor de LLM (Language Model) unificado"""
@@ -15,27 +38,10 @@ class LLMProvider:
         self.message_history = []
         self.max_history = 50
 
-        # Respostas temporárias (mock) - Remover quando implementar a API real
-        self._mock_responses = [
-            "Entendi! Vou ajudar você com isso.",
-            "Interessante! Pode me contar mais?",
-            "Hmm, deixa eu pensar...",
-            "Que legal! Vamos explorar essa ideia.",
-            "Ótima pergunta! Vou tentar responder da melhor forma possível.",
-            "Isso é muito interessante! Vamos discutir mais sobre isso.",
-            "Entendo seu ponto de vista. Aqui está o que penso...",
-            "Que tal considerarmos uma abordagem diferente?",
-            "Vou pesquisar mais sobre isso e te dar uma resposta mais completa.",
-            "Excelente observação! Vamos analisar em detalhes.",
-        ]
-
-        self._mock_file_responses = [
-            "Analisando o arquivo... parece ser um {type} interessante!",
-            "Recebi seu arquivo! Vou dar uma olhada nesse {type}.",
-            "Legal! Vou processar esse {type} e te dar um feedback.",
-            "Ótimo! Vou analisar esse {type} e te ajudar com ele.",
-            "Arquivo recebido! Vou examinar esse {type} com atenção.",
-        ]
+        # Respostas temporárias (mock), compartilhadas entre instâncias
+        self._mock_responses = _MOCK_RESPONSES
+        self._mock_file_responses = _MOCK_FILE_RESPONSES
+        self._mock_stream = iter(())
 
     def get_response(
         self,
@@ -57,9 +63,7 @@ class LLMProvider:
         try:
             # TODO: Implementar chamada real à API do modelo
             # Por enquanto, retorna uma resposta mock
-            import random
-
-            return random.choice(self._mock_responses)
+            return self._next_mock_response()
 
         except Exception as e:
             logger.error(f"Erro ao gerar resposta: {str(e)}")
@@ -67,6 +71,14 @@ class LLMProvider:
                 "Desculpe, não consegui processar sua mensagem. Pode tentar novamente?"
             )
 
+    def _next_mock_response(self) -> str:
+        """Retorna a próxima resposta mock, sorteadas em lotes de 64"""
+        try:
+            return next(self._mock_stream)
+        except StopIteration:
+            self._mock_stream = iter(random.choices(self._mock_responses, k=64))
+            return next(self._mock_stream)
+
     def analyze_file(self, file_path: str, file_type: str) -> str:
         """
         Analisa um arquivo usando o modelo
@@ -81,8 +93,6 @@ class LLMProvider:
         try:
             # TODO: Implementar análise real de arquivo
             # Por enquanto, retorna uma resposta mock
-            import random
-
             type_name = file_type[1:] if file_type.startswith(".") else file_type
             return random.choice(self._mock_file_responses).format(
                 type=type_name.upper()
@@ -16,18 +16,36 @@ class ProjectManager:
         os.makedirs(self.projects_dir, exist_ok=True)
         self.project_frames = {}  # Map project frames to project data
 
+        # Results of list_projects/list_conversations, dropped by every write
+        # made through this manager (see invalidate_cache)
+        self._list_cache = {}
+
+    def invalidate_cache(self):
+        """Forget cached project and conversation lists"""
+        self._list_cache.clear()
+
     def list_projects(self) -> List[Dict]:
-        """List all projects"""
+        """List all projects, newest first"""
         try:
-            return self.db.get_all_projects()
+            projects = self._list_cache.get("projects")
+            if projects is None:
+                projects = self._list_cache["projects"] = self.db.get_all_projects()
+            # Hand out a copy so callers cannot reorder or trim the cache
+            return list(projects)
         except Exception as e:
             logger.error(f"Error listing projects: {str(e)}")
             return []
 
     def list_conversations(self) -> List[Dict]:
-        """List all standalone conversations"""
+        """List all standalone conversations, newest first"""
         try:
-            return self.db.get_all_conversations()
+            conversations = self._list_cache.get("conversations")
+            if conversations is None:
+                conversations = self._list_cache["conversations"] = (
+                    self.db.get_all_conversations()
+                )
+            # Hand out a copy so callers cannot reorder or trim the cache
+            return list(conversations)
         except Exception as e:
             logger.error(f"Error listing conversations: {str(e)}")
             return []
@@ -37,12 +55,14 @@ class ProjectManager:
     ) -> Optional[int]:
         """Create a new project"""
         try:
+            self.invalidate_cache()
+            now = datetime.now()
             project_data = {
                 "name": name,
                 "description": description,
                 "instructions": instructions,
-                "created_at": datetime.now(),
-                "updated_at": datetime.now(),
+                "created_at": now,
+                "updated_at": now,
             }
             return self.db.create_project(project_data)
         except Exception as e:
@@ -52,11 +72,13 @@ class ProjectManager:
     def create_conversation(self, title: str = None) -> Optional[int]:
         """Create a new standalone conversation"""
         try:
-            default_title = f"Conversation {datetime.now().strftime('%Y-%m-%d %H:%M')}"
+            self.invalidate_cache()
+            now = datetime.now()
+            default_title = f"Conversation {now.strftime('%Y-%m-%d %H:%M')}"
             conversation_data = {
                 "title": title or default_title,
-                "created_at": datetime.now(),
-                "updated_at": datetime.now(),
+                "created_at": now,
+                "updated_at": now,
                 "messages": [],
             }
             return self.db.create_conversation(conversation_data)
@@ -67,6 +89,7 @@ class ProjectManager:
     def update_project(self, project_id: int, data: dict) -> bool:
         """Update project data"""
         try:
+            self.invalidate_cache()
             data["updated_at"] = datetime.now()
             return self.db.update_project(project_id, data)
         except Exception as e:
@@ -76,6 +99,7 @@ class ProjectManager:
     def update_conversation(self, conversation_id: int, data: dict) -> bool:
         """Update conversation data"""
         try:
+            self.invalidate_cache()
             data["updated_at"] = datetime.now()
             return self.db.update_conversation(conversation_id, data)
         except Exception as e:
@@ -85,6 +109,7 @@ class ProjectManager:
     def delete_project(self, project_id: int) -> bool:
         """Delete a project"""
         try:
+            self.invalidate_cache()
             return self.db.delete_project(project_id)
         except Exception as e:
             logger.error(f"Error deleting project: {str(e)}")
@@ -93,6 +118,7 @@ class ProjectManager:
     def delete_conversation(self, conversation_id: int) -> bool:
         """Delete a conversation"""
         try:
+            self.invalidate_cache()
             return self.db.delete_conversation(conversation_id)
         except Exception as e:
             logger.error(f"Error deleting conversation: {str(e)}")
@@ -103,18 +129,20 @@ class ProjectManager:
     ) -> Optional[int]:
         """Convert a conversation to a project"""
         try:
+            self.invalidate_cache()
             # Get conversation data
             conversation = self.db.get_conversation(conversation_id)
             if not conversation:
                 return None
 
             # Create new project
+            now = datetime.now()
             project_data = {
                 "name": name,
                 "description": description,
                 "instructions": "",
-                "created_at": datetime.now(),
-                "updated_at": datetime.now(),
+                "created_at": now,
+                "updated_at": now,
             }
 
             # Create project
@@ -122,9 +150,10 @@ class ProjectManager:
             if not project_id:
                 return None
 
-            # Move messages to project
-            for message in conversation.get("messages", []):
-                self.db.add_message_to_project(project_id, message)
+            # Move messages to project in one batch
+            messages = conversation.get("messages", [])
+            if messages:
+                self.db.add_messages_to_project(project_id, messages)
 
             # Delete the original conversation
             self.db.delete_conversation(conversation_id)
@@ -139,16 +168,15 @@ class ProjectManager:
     ) -> Optional[int]:
         """Add a message to a conversation"""
         try:
+            self.invalidate_cache()
             message = {
                 "content": content,
                 "sender": sender,
                 "created_at": datetime.now(),
             }
 
-            message_id = self.db.add_message(conversation_id, message)
-
-            # Update conversation last update time
-            self.db.update_conversation(conversation_id, {"updated_at": datetime.now()})
+            # Inserted together with the conversation's updated_at bump
+            message_id = self.db.add_conversation_message(conversation_id, message)
 
             return message_id
         except Exception as e:
@@ -160,6 +188,7 @@ class ProjectManager:
     ) -> Optional[int]:
         """Add a message to a project"""
         try:
+            self.invalidate_cache()
             message = {
                 "content": content,
                 "sender": sender,
@@ -167,10 +196,8 @@ class ProjectManager:
                 "project_id": project_id,
             }
 
-            message_id = self.db.add_message(None, message)
-
-            # Update project last update time
-            self.db.update_project(project_id, {"updated_at": datetime.now()})
+            # Inserted together with the project's updated_at bump
+            message_id = self.db.add_project_message(project_id, message)
 
             return message_id
         except Exception as e:
@@ -196,6 +223,7 @@ class ProjectManager:
     def mark_as_read(self, conversation_id: int) -> bool:
         """Mark a conversation as read"""
         try:
+            self.invalidate_cache()
             return self.db.update_conversation(
                 conversation_id, {"unread": False, "updated_at": datetime.now()}
             )
@@ -206,6 +234,7 @@ class ProjectManager:
     def mark_as_unread(self, conversation_id: int) -> bool:
         """Mark a conversation as unread"""
         try:
+            self.invalidate_cache()
             return self.db.update_conversation(
                 conversation_id, {"unread": True, "updated_at": datetime.now()}
             )
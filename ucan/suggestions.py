@@ -1,4 +1,7 @@
+import bisect
+import functools
 import logging
+import re
 from typing import List, Tuple
 
 import emoji
@@ -6,35 +9,76 @@ import emoji
 logger = logging.getLogger("UCAN")
 
 
+def _prefix_range(keys, prefix: str) -> Tuple[int, int]:
+    """Start and end of the entries of sorted ``keys`` starting with ``prefix``"""
+    start = bisect.bisect_left(keys, prefix)
+    end = start
+    while end < len(keys) and keys[end].startswith(prefix):
+        end += 1
+    return start, end
+
+
+@functools.lru_cache(maxsize=None)
+def _emoji_index() -> Tuple[Tuple[str, str, str], ...]:
+    """(lowercased name, label, emoji) for every emoji, built on first use"""
+    return tuple(
+        (name.lower(), f":{name}:", char) for name, char in emoji.EMOJI_DATA.items()
+    )
+
+
 class SuggestionsManager:
+    # Constant tables, shared by every instance instead of rebuilt per init
+    COMMANDS = {
+        "/clear": "Limpa o chat",
+        "/help": "Mostra ajuda",
+        "/export": "Exporta a conversa",
+        "/theme": "Alterna tema claro/escuro",
+        "/new": "Nova conversa",
+        "/template": "Gerencia templates",
+    }
+    EMOJI_SHORTCUTS = {
+        ":)": "😊",
+        ":(": "😢",
+        ":D": "😃",
+        ";)": "😉",
+        "<3": "❤️",
+        ":+1:": "👍",
+        ":thumbsup:": "👍",
+        ":smile:": "😊",
+        ":laugh:": "😄",
+        ":sad:": "😢",
+        ":cry:": "😭",
+        ":heart:": "❤️",
+        ":fire:": "🔥",
+        ":check:": "✅",
+        ":x:": "❌",
+        ":star:": "⭐",
+    }
+
+    # Sorted views of the tables above for bisect prefix lookups
+    _COMMAND_ENTRIES = tuple(sorted(COMMANDS.items()))
+    _COMMAND_KEYS = tuple(cmd for cmd, _ in _COMMAND_ENTRIES)
+    _SHORTCUT_ENTRIES = tuple(
+        sorted(
+            (shortcut.lower(), shortcut, char)
+            for shortcut, char in EMOJI_SHORTCUTS.items()
+        )
+    )
+    _SHORTCUT_KEYS = tuple(key for key, _, _ in _SHORTCUT_ENTRIES)
+
+    # All shortcuts in one alternation, longest first so ":thumbsup:" wins over
+    # any shorter shortcut it contains
+    _SHORTCUT_RE = re.compile(
+        "|".join(
+            re.escape(shortcut)
+            for shortcut in sorted(EMOJI_SHORTCUTS, key=len, reverse=True)
+        )
+    )
+
     def __init__(self, db):
         self.db = db
-        self.commands = {
-            "/clear": "Limpa o chat",
-            "/help": "Mostra ajuda",
-            "/export": "Exporta a conversa",
-            "/theme": "Alterna tema claro/escuro",
-            "/new": "Nova conversa",
-            "/template": "Gerencia templates",
-        }
-        self.emoji_shortcuts = {
-            ":)": "😊",
-            ":(": "😢",
-            ":D": "😃",
-            ";)": "😉",
-            "<3": "❤️",
-            ":+1:": "👍",
-            ":thumbsup:": "👍",
-            ":smile:": "😊",
-            ":laugh:": "😄",
-            ":sad:": "😢",
-            ":cry:": "😭",
-            ":heart:": "❤️",
-            ":fire:": "🔥",
-            ":check:": "✅",
-            ":x:": "❌",
-            ":star:": "⭐",
-        }
+        self.commands = self.COMMANDS
+        self.emoji_shortcuts = self.EMOJI_SHORTCUTS
 
     def get_suggestions(
         self, current_text: str, cursor_position: int
@@ -69,32 +113,31 @@ class SuggestionsManager:
 
     def _get_command_suggestions(self, prefix: str) -> List[Tuple[str, str]]:
         """Get command suggestions"""
-        return [
-            (cmd, desc)
-            for cmd, desc in self.commands.items()
-            if cmd.startswith(prefix.lower())
-        ]
+        start, end = _prefix_range(self._COMMAND_KEYS, prefix.lower())
+        return list(self._COMMAND_ENTRIES[start:end])
 
     def _get_emoji_suggestions(self, prefix: str) -> List[Tuple[str, str]]:
         """Get emoji suggestions"""
+        prefix = prefix.lower()
+
         # First check shortcuts
+        start, end = _prefix_range(self._SHORTCUT_KEYS, prefix)
         shortcut_suggestions = [
             (shortcut, emoji_char)
-            for shortcut, emoji_char in self.emoji_shortcuts.items()
-            if shortcut.lower().startswith(prefix.lower())
+            for _, shortcut, emoji_char in self._SHORTCUT_ENTRIES[start:end]
         ]
 
-        # Then check emoji names
+        # Then check emoji names, stopping at the first 10 matches
         emoji_suggestions = []
         if len(prefix) > 1:
-            search_term = prefix[1:].lower()  # Remove the initial ":"
-            emoji_suggestions = [
-                (f":{name}:", char)
-                for name, char in emoji.EMOJI_DATA.items()
-                if search_term in name.lower()
-            ]
+            search_term = prefix[1:]  # Remove the initial ":"
+            for name_lower, label, char in _emoji_index():
+                if search_term in name_lower:
+                    emoji_suggestions.append((label, char))
+                    if len(emoji_suggestions) == 10:
+                        break
 
-        return shortcut_suggestions + emoji_suggestions[:10]
+        return shortcut_suggestions + emoji_suggestions
 
     def _get_message_suggestions(self, text: str) -> List[Tuple[str, str]]:
         """Get message suggestions based on history"""
@@ -121,9 +164,10 @@ class SuggestionsManager:
     def replace_emoji_shortcuts(self, text: str) -> str:
         """Replace emoji shortcuts with actual emojis"""
         try:
-            for shortcut, emoji_char in self.emoji_shortcuts.items():
-                text = text.replace(shortcut, emoji_char)
-            return text
+            # One pass over the text instead of one per shortcut
+            return self._SHORTCUT_RE.sub(
+                lambda match: self.emoji_shortcuts[match.group(0)], text
+            )
         except Exception as e:
             logger.error(f"Error replacing emoji shortcuts: {str(e)}")
             return text
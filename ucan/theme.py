@@ -195,6 +195,42 @@ BUTTON_STYLES = {
     },
 }
 
+# Shared CTkFont instances, created on first use (a Tk root must exist first)
+_FONT_CACHE = {}
+
+
+def get_font(size, weight="normal"):
+    """Get a shared CTkFont instance for the given size and weight"""
+    key = (size, weight)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        font = ctk.CTkFont(size=size, weight=weight)
+        _FONT_CACHE[key] = font
+    return font
+
+
+# Theme last pushed to CustomTkinter; every ThemeManager instance applies its
+# theme, and re-applying an unchanged one reloads the theme JSON from disk
+_APPLIED_THEME = None
+
+# Contents of ~/.ucan/config.json, read by the first ThemeManager and shared
+# with the later ones (most widgets create their own manager)
+_CONFIG = None
+
+
+def _load_config():
+    """Read the config file once; later calls return the shared dict"""
+    global _CONFIG
+    if _CONFIG is None:
+        config_path = os.path.expanduser("~/.ucan/config.json")
+        try:
+            with open(config_path, "r") as f:
+                _CONFIG = json.load(f)
+        except FileNotFoundError:
+            # No config yet, start from an empty one
+            _CONFIG = {}
+    return _CONFIG
+
 
 class ThemeManager:
     """Manages the application theme and colors"""
@@ -203,6 +239,9 @@ class ThemeManager:
         self.theme = "dark"
         self.high_contrast = False
 
+        # Last known config file contents, kept so saves don't re-read the file
+        self._config = {}
+
         # Load theme from config file if it exists
         self.load_theme()
 
@@ -274,6 +313,11 @@ class ThemeManager:
 
     def apply_theme(self):
         """Apply theme to CustomTkinter"""
+        global _APPLIED_THEME
+        if _APPLIED_THEME == self.theme:
+            return
+        _APPLIED_THEME = self.theme
+
         appearance_mode = "Dark" if self.theme == "dark" else "Light"
         ctk.set_appearance_mode(appearance_mode)
 
@@ -290,15 +334,14 @@ class ThemeManager:
     def load_theme(self):
         """Load theme settings from config file"""
         try:
-            config_path = os.path.expanduser("~/.ucan/config.json")
-            if os.path.exists(config_path):
-                with open(config_path, "r") as f:
-                    config = json.load(f)
-                    self.theme = config.get("theme", "dark")
-                    self.high_contrast = config.get("high_contrast", False)
-                    logger.info(
-                        f"Loaded theme: {self.theme}, high contrast: {self.high_contrast}"
-                    )
+            config = _load_config()
+            self._config = config
+            if config:
+                self.theme = config.get("theme", "dark")
+                self.high_contrast = config.get("high_contrast", False)
+                logger.info(
+                    f"Loaded theme: {self.theme}, high contrast: {self.high_contrast}"
+                )
         except Exception as e:
             logger.error(f"Error loading theme: {e}")
             # Default to dark theme if there's an error
@@ -311,19 +354,30 @@ class ThemeManager:
             config_path = os.path.expanduser("~/.ucan/config.json")
             os.makedirs(os.path.dirname(config_path), exist_ok=True)
 
-            # Load existing config if it exists
-            config = {}
-            if os.path.exists(config_path):
-                with open(config_path, "r") as f:
-                    config = json.load(f)
+            # Update the shared config in place so other managers see it too
+            config = self._config
 
             # Update theme settings
             config["theme"] = self.theme
             config["high_contrast"] = self.high_contrast
 
-            # Save updated config
-            with open(config_path, "w") as f:
-                json.dump(config, f, indent=2)
+            # Serialize in one go and swap the file in atomically, so an
+            # interrupted save never leaves a truncated config behind
+            data = json.dumps(config, indent=2).encode("utf-8")
+            tmp_path = config_path + ".tmp"
+            try:
+                with open(tmp_path, "wb") as f:
+                    f.write(data)
+                    # Make the data durable before the rename publishes it
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, config_path)
+            except Exception:
+                try:
+                    os.unlink(tmp_path)
+                except FileNotFoundError:
+                    pass
+                raise
 
             logger.info(
                 f"Saved theme: {self.theme}, high contrast: {self.high_contrast}"
@@ -1,5 +1,11 @@
+import functools
 import logging
+import os
+import platform
+import shutil
+import subprocess
 import sys
+import uuid
 from datetime import datetime
 from tkinter import filedialog, messagebox
 
@@ -9,15 +15,53 @@ from .attachments import AttachmentManager
 from .database import Database
 from .llm import LLMProvider
 from .projects import ProjectManager
-from .theme import ThemeManager
+from .theme import ThemeManager, get_font
 from .widgets import MessagesContainer, ProjectPanel, ThinkingIndicator
 
 logger = logging.getLogger("UCAN")
 
 
+@functools.lru_cache(maxsize=4096)
+def format_timestamp(timestamp: str) -> str:
+    """Format a database timestamp for display, caching repeated values"""
+    # Fast path for "YYYY-MM-DD HH:MM..." (also matches ISO "T" and fractions)
+    if (
+        isinstance(timestamp, str)
+        and len(timestamp) >= 16
+        and timestamp[4] == "-"
+        and timestamp[7] == "-"
+        and timestamp[13] == ":"
+    ):
+        return f"{timestamp[8:10]}/{timestamp[5:7]}/{timestamp[:4]} {timestamp[11:16]}"
+
+    try:
+        dt = datetime.fromisoformat(timestamp)
+        return dt.strftime("%d/%m/%Y %H:%M")
+    except (TypeError, ValueError):
+        return timestamp
+
+
+def truncate_text(text, limit, keep=None):
+    """Cut text longer than limit down to keep characters plus an ellipsis"""
+    if len(text) <= limit:
+        return text
+    return f"{text[: limit if keep is None else keep]}..."
+
+
+def search_key(*parts):
+    """Build the lowercased text a sidebar item is matched against"""
+    return " ".join(part for part in parts if part).lower()
+
+
 class ChatApp(ctk.CTk):
     """Interface principal do chat"""
 
+    # Hidden conversation views kept alive for quick switching
+    MAX_CACHED_VIEWS = 4
+
+    # Messages fetched when a conversation opens, and per "older" page
+    HISTORY_PAGE_SIZE = 50
+
     def __init__(self):
         """Inicializa a interface"""
         super().__init__()
@@ -43,7 +87,7 @@ class ChatApp(ctk.CTk):
         self.db = Database()
 
         # Generate test data if database is empty
-        if not self.db.get_all_projects():
+        if not self.db.has_projects():
             self.db.generate_test_data()
 
         # Inicializa gerenciador de anexos
@@ -59,6 +103,13 @@ class ChatApp(ctk.CTk):
         self.conversations_container = None
         self.projects_container = None
 
+        # (projects, conversations) lists of (search key, row frame), rebuilt
+        # on each full sidebar load; searches only show/hide these rows
+        self._sidebar_index = None
+
+        # "No results" labels shown by the current search filter
+        self._sidebar_empty_labels = []
+
         # Inicializa provedor de AI
         self.ai_provider = LLMProvider()
 
@@ -69,6 +120,28 @@ class ChatApp(ctk.CTk):
         self.notification_queue = []
         self.is_notification_showing = False
 
+        # Pending after_idle callback of an in-progress history load
+        self._history_after_id = None
+
+        # Pending timer of the welcome message, so a newer chat replaces it
+        self._welcome_after_id = None
+
+        # (conversation id, container, generation) of the conversation shown in
+        # messages_container, and hidden views of recent conversations by id
+        self._rendered_view = None
+        self._conversation_views = {}
+
+        # Database writes queued by the send path, flushed together when idle
+        self._pending_writes = []
+
+        # Translation dialog, built on first use and then reused
+        self._translate_dialog = None
+        self._translate_source = ""
+
+        # Replies still being generated; the thinking indicator stays up until
+        # the last one arrives instead of flickering between them
+        self._pending_replies = 0
+
         logger.info("Aplicação inicializada com sucesso")
 
         # Schedule showing the window when ready (after UI is built and idle)
@@ -80,27 +153,17 @@ class ChatApp(ctk.CTk):
         # Flag to track if suggestions have been added
         self.suggestions_added = False
 
-        # Schedule loading of projects and conversations after UI is fully rendered
-        self.after(100, self.refresh_sidebar_content)
+        # Load projects and conversations once the skeleton is built, instead of
+        # querying the database while the layout is being constructed
+        self.after_idle(self.refresh_sidebar_content)
 
     def refresh_sidebar_content(self):
         """Refresh sidebar content including projects and conversations"""
         try:
-            # Clear and reload projects
-            if hasattr(self, "projects_container") and self.projects_container:
-                for widget in self.projects_container.winfo_children():
-                    widget.destroy()
+            # Reload projects and conversations
+            if self.projects_container and self.conversations_container:
                 self.load_projects()
 
-            # Clear and reload conversations
-            if (
-                hasattr(self, "conversations_container")
-                and self.conversations_container
-            ):
-                for widget in self.conversations_container.winfo_children():
-                    widget.destroy()
-                self.list_conversations()
-
             # Show notification about loaded content
             self.show_notification("Projetos e conversas carregados", "info")
         except Exception as e:
@@ -159,7 +222,7 @@ class ChatApp(ctk.CTk):
         self.contact_info = ctk.CTkLabel(
             contact_container,
             text="UCAN Assistant",
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=get_font(18, "bold"),
             text_color=self.colors["text"],
         )
         self.contact_info.pack(anchor="w", padx=(16, 0))
@@ -167,7 +230,7 @@ class ChatApp(ctk.CTk):
         self.contact_status = ctk.CTkLabel(
             contact_container,
             text="Pronto para ajudar",
-            font=ctk.CTkFont(size=13),
+            font=get_font(13),
             text_color=self.colors["text_secondary"],
         )
         self.contact_status.pack(anchor="w", padx=(16, 0))
@@ -200,64 +263,19 @@ class ChatApp(ctk.CTk):
         chat_actions.pack(side="left", padx=8)
 
         # New chat icon button
-        new_chat_btn = ctk.CTkButton(
-            chat_actions,
-            text="💬",
-            width=36,
-            height=36,
-            corner_radius=0,
-            fg_color="transparent",
-            hover_color=self.colors["surface_hover"],
-            text_color=self.colors["text"],
-            command=self.new_chat,
-        )
-        new_chat_btn.pack(side="left")
+        new_chat_btn = self._create_pill_button(chat_actions, "💬", self.new_chat)
 
         # Add divider
-        divider1 = ctk.CTkFrame(
-            chat_actions,
-            width=1,
-            height=20,
-            fg_color=self.colors["border"],
-        )
-        divider1.pack(side="left")
+        self._create_pill_divider(chat_actions)
 
         # Export conversation button
-        export_btn = ctk.CTkButton(
-            chat_actions,
-            text="📤",
-            width=36,
-            height=36,
-            corner_radius=0,
-            fg_color="transparent",
-            hover_color=self.colors["surface_hover"],
-            text_color=self.colors["text"],
-            command=self.export_chat,
-        )
-        export_btn.pack(side="left")
+        export_btn = self._create_pill_button(chat_actions, "📤", self.export_chat)
 
         # Add divider
-        divider2 = ctk.CTkFrame(
-            chat_actions,
-            width=1,
-            height=20,
-            fg_color=self.colors["border"],
-        )
-        divider2.pack(side="left")
+        self._create_pill_divider(chat_actions)
 
         # Clear chat button
-        clear_btn = ctk.CTkButton(
-            chat_actions,
-            text="🗑",
-            width=36,
-            height=36,
-            corner_radius=0,
-            fg_color="transparent",
-            hover_color=self.colors["surface_hover"],
-            text_color=self.colors["text"],
-            command=self.clear_chat,
-        )
-        clear_btn.pack(side="left")
+        clear_btn = self._create_pill_button(chat_actions, "🗑", self.clear_chat)
 
         # Tooltip for new chat
         new_chat_tooltip = ctk.CTkLabel(
@@ -266,7 +284,7 @@ class ChatApp(ctk.CTk):
             fg_color=self.colors["surface"],
             corner_radius=6,
             text_color=self.colors["text"],
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             padx=8,
             pady=4,
         )
@@ -314,7 +332,7 @@ class ChatApp(ctk.CTk):
             fg_color=self.colors["surface"],
             corner_radius=6,
             text_color=self.colors["text"],
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             padx=8,
             pady=4,
         )
@@ -349,7 +367,7 @@ class ChatApp(ctk.CTk):
             fg_color=self.colors["surface"],
             corner_radius=6,
             text_color=self.colors["text"],
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             padx=8,
             pady=4,
         )
@@ -408,7 +426,7 @@ class ChatApp(ctk.CTk):
             fg_color=self.colors["surface"],
             corner_radius=6,
             text_color=self.colors["text"],
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             padx=8,
             pady=4,
         )
@@ -472,7 +490,7 @@ class ChatApp(ctk.CTk):
             height=70,
             fg_color="transparent",
             border_width=0,
-            font=ctk.CTkFont(size=15),
+            font=get_font(15),
             text_color=self.colors["text"],
         )
         self.text_input.pack(fill="both", expand=True)
@@ -504,7 +522,7 @@ class ChatApp(ctk.CTk):
             char_count_frame,
             text="0/4000",
             text_color=self.colors["text_secondary"],
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
         )
         self.char_count.pack(side="right")
 
@@ -557,7 +575,7 @@ class ChatApp(ctk.CTk):
                 fg_color=self.colors["surface"],
                 corner_radius=6,
                 text_color=self.colors["text"],
-                font=ctk.CTkFont(size=12),
+                font=get_font(12),
                 padx=8,
                 pady=4,
             )
@@ -611,8 +629,8 @@ class ChatApp(ctk.CTk):
                 fg_color="transparent",
                 hover_color=self.colors["surface_hover"],
                 text_color=self.colors["text"],
-                font=ctk.CTkFont(size=14, weight="bold"),
-                command=lambda fmt=option["format"]: self.format_text(fmt),
+                font=get_font(14, "bold"),
+                command=functools.partial(self.format_text, option["format"]),
                 border_width=0,
             )
             btn.pack(side="left")
@@ -634,7 +652,7 @@ class ChatApp(ctk.CTk):
                 fg_color=self.colors["surface"],
                 corner_radius=6,
                 text_color=self.colors["text"],
-                font=ctk.CTkFont(size=12),
+                font=get_font(12),
                 padx=8,
                 pady=4,
             )
@@ -667,7 +685,7 @@ class ChatApp(ctk.CTk):
             fg_color=self.colors["primary"],
             hover_color=self.colors["primary_dark"],
             text_color=self.colors["text_light"],
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=get_font(14, "bold"),
             command=self.send_message,
         )
         # Use place instead of pack for more precise alignment
@@ -677,7 +695,7 @@ class ChatApp(ctk.CTk):
         self.send_icon = ctk.CTkLabel(
             self.send_btn,
             text="→",
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=get_font(16, "bold"),
             text_color=self.colors["text_light"],
         )
         self.send_icon.place(relx=0.85, rely=0.5, anchor="center")
@@ -686,29 +704,22 @@ class ChatApp(ctk.CTk):
         self.char_counter = ctk.CTkLabel(
             toolbar,  # Attach to toolbar instead of input_container
             text="0/4000",
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             text_color=self.colors["text_secondary"],
         )
         self.char_counter.pack(
             side="left", padx=(16, 0)
         )  # Position on left side of toolbar
 
-        # Handle focus events with improved styling
+        # Handle focus events with improved styling (the placeholder itself is
+        # handled by _clear_placeholder/_add_placeholder)
         def on_entry_focus_in(event):
-            if self.text_input.get("1.0", "end-1c") == "Digite sua mensagem...":
-                self.text_input.delete("1.0", "end")
-                self.text_input.configure(text_color=self.colors["text"])
-
             # Update border color with subtle glow effect
             self.input_container.configure(
                 border_color=self.colors["primary"], border_width=2
             )
 
         def on_entry_focus_out(event):
-            if not self.text_input.get("1.0", "end-1c").strip():
-                self.text_input.insert("1.0", "Digite sua mensagem...")
-                self.text_input.configure(text_color=self.colors["text_secondary"])
-
             # Reset border
             self.input_container.configure(
                 border_color=self.colors["border"], border_width=1
@@ -717,26 +728,16 @@ class ChatApp(ctk.CTk):
         self.text_input.bind("<FocusIn>", on_entry_focus_in)
         self.text_input.bind("<FocusOut>", on_entry_focus_out)
 
-        # Initial placeholder text
-        self.text_input.insert("1.0", "Digite sua mensagem...")
-        self.text_input.configure(text_color=self.colors["text_secondary"])
-
-        # Setup placeholder state
-        self._placeholder_visible = True
-
         # Setup key bindings
         self.setup_input_handling()
 
         # Update character counter
         def update_counter(event=None):
-            text = self.text_input.get("1.0", "end-1c")
             # Don't count placeholder text
-            if text == "Digite sua mensagem...":
+            if self.is_placeholder:
                 count = 0
-                self._placeholder_visible = True
             else:
-                count = len(text)
-                self._placeholder_visible = False
+                count = len(self.text_input.get("1.0", "end-1c"))
 
             # Update counter with nice formatting
             self.char_counter.configure(text=f"{count}/4000")
@@ -755,22 +756,18 @@ class ChatApp(ctk.CTk):
 
             # Update send button state
             if hasattr(self, "send_btn"):
-                self.send_btn.configure(
-                    state="normal"
-                    if count > 0 and text != "Digite sua mensagem..."
-                    else "disabled"
-                )
+                self.send_btn.configure(state="normal" if count > 0 else "disabled")
 
         # Character counter
         self.text_input.bind("<KeyRelease>", update_counter)
 
         # Add hover animation for send button
         def on_send_enter(e):
-            self.send_icon.configure(font=ctk.CTkFont(size=18, weight="bold"))
+            self.send_icon.configure(font=get_font(18, "bold"))
             self.send_btn.configure(fg_color=self.colors["primary_dark"])
 
         def on_send_leave(e):
-            self.send_icon.configure(font=ctk.CTkFont(size=16, weight="bold"))
+            self.send_icon.configure(font=get_font(16, "bold"))
             self.send_btn.configure(fg_color=self.colors["primary"])
 
         self.send_btn.bind("<Enter>", on_send_enter)
@@ -794,8 +791,9 @@ class ChatApp(ctk.CTk):
     def send_message(self, event=None):
         """Send a message from the input field"""
         try:
-            # Check if placeholder is visible
-            if hasattr(self, "is_placeholder") and self.is_placeholder:
+            # Nothing to send if the placeholder is showing or the input is
+            # empty; checked without copying the buffer out of Tk
+            if self.is_placeholder or self.text_input.compare("end-1c", "==", "1.0"):
                 return
 
             # Get message text
@@ -811,7 +809,9 @@ class ChatApp(ctk.CTk):
             # Save message to database if we have a current conversation
             if hasattr(self, "current_conversation") and self.current_conversation:
                 conversation_id = self.current_conversation["id"]
-                self.project_manager.add_message(conversation_id, message, "Você")
+                self._queue_write(
+                    self.project_manager.add_message, conversation_id, message, "Você"
+                )
 
             # Clear input
             self.text_input.delete("1.0", "end")
@@ -821,6 +821,7 @@ class ChatApp(ctk.CTk):
             self.text_input.focus_set()
 
             # Start thinking animation
+            self._pending_replies += 1
             self.thinking.start()
 
             # Process with AI (simulated delay)
@@ -830,6 +831,26 @@ class ChatApp(ctk.CTk):
             logger.error(f"Error sending message: {str(e)}")
             messagebox.showerror("Error", "Erro ao enviar mensagem. Tente novamente.")
 
+    def _queue_write(self, func, *args):
+        """Queue a database write to run once the UI is idle"""
+        if not self._pending_writes:
+            self.after_idle(self._flush_writes)
+        self._pending_writes.append((func, args))
+
+    def _flush_writes(self):
+        """Run all queued database writes"""
+        writes, self._pending_writes = self._pending_writes, []
+        for func, args in writes:
+            try:
+                func(*args)
+            except Exception as e:
+                logger.error(f"Error saving to database: {str(e)}")
+
+    def destroy(self):
+        """Save queued writes before the window goes away"""
+        self._flush_writes()
+        super().destroy()
+
     def format_text(self, format_type):
         """Format selected text in the input field"""
         # Clear placeholder if present
@@ -987,8 +1008,13 @@ class ChatApp(ctk.CTk):
             if messagebox.askyesno(
                 "Limpar Chat", "Tem certeza que deseja limpar o chat?"
             ):
-                # Clear messages
-                self.messages_container.clear_messages()
+                # Rebuild the container instead of clearing it: destroying the
+                # old one tears down every message widget in a single Tk call
+                self._cancel_history_load()
+                old_container = self.messages_container
+                self.setup_messages_container()
+                old_container.destroy()
+                self.suggestions_added = False
 
                 # Add start message
                 self.start_chat()
@@ -1002,6 +1028,12 @@ class ChatApp(ctk.CTk):
         colors = self.theme_manager.toggle_theme()
         self.colors = colors
 
+        # Hidden views would keep the old colors
+        self._drop_conversation_views()
+        if self._translate_dialog is not None:
+            self._translate_dialog.destroy()
+            self._translate_dialog = None
+
         # Apply new colors to all UI elements
         self._apply_theme_colors()
 
@@ -1030,7 +1062,7 @@ class ChatApp(ctk.CTk):
             notification,
             text=message,
             text_color=self.colors["text_light"],
-            font=ctk.CTkFont(size=14),
+            font=get_font(14),
         )
         notification_text.place(relx=0.5, rely=0.5, anchor="center")
 
@@ -1090,18 +1122,15 @@ class ChatApp(ctk.CTk):
                 self.suggestions_added = False
 
             # Adiciona mensagem de boas-vindas com animação
-            self.after(
-                500,
-                lambda: self.add_message(
-                    "👋 Olá! Sou o UCAN, seu assistente virtual.\n\n"
-                    "Estou aqui para ajudar você com:\n"
-                    "• Respostas para suas perguntas\n"
-                    "• Gerenciamento de projetos\n"
-                    "• Uso de templates de mensagem\n"
-                    "• Análise de informações\n\n"
-                    "Como posso ajudar você hoje?",
-                    "Assistente",
-                ),
+            self._schedule_welcome(
+                "👋 Olá! Sou o UCAN, seu assistente virtual.\n\n"
+                "Estou aqui para ajudar você com:\n"
+                "• Respostas para suas perguntas\n"
+                "• Gerenciamento de projetos\n"
+                "• Uso de templates de mensagem\n"
+                "• Análise de informações\n\n"
+                "Como posso ajudar você hoje?",
+                "Assistente",
             )
 
             # Add suggestions section only if not already added
@@ -1117,6 +1146,24 @@ class ChatApp(ctk.CTk):
             logger.error(f"Erro ao iniciar chat: {str(e)}")
             messagebox.showerror("Erro", "Não foi possível iniciar o chat.")
 
+    def _schedule_welcome(self, text, sender):
+        """Show the welcome message shortly, replacing any still pending"""
+        self._cancel_welcome()
+        self._welcome_after_id = self.after(
+            500, functools.partial(self._show_welcome, text, sender)
+        )
+
+    def _show_welcome(self, text, sender):
+        """Add the scheduled welcome message"""
+        self._welcome_after_id = None
+        self.add_message(text, sender)
+
+    def _cancel_welcome(self):
+        """Cancel a welcome message that has not been shown yet"""
+        if self._welcome_after_id is not None:
+            self.after_cancel(self._welcome_after_id)
+            self._welcome_after_id = None
+
     def add_suggestions(self, suggestions):
         """Add suggestion buttons to the chat"""
         try:
@@ -1130,7 +1177,7 @@ class ChatApp(ctk.CTk):
             suggestions_label = ctk.CTkLabel(
                 suggestions_container,
                 text="Sugestões para começar:",
-                font=ctk.CTkFont(size=14, weight="bold"),
+                font=get_font(14, "bold"),
                 text_color=self.colors["text_secondary"],
             )
             suggestions_label.pack(anchor="w", pady=(16, 8))
@@ -1164,8 +1211,8 @@ class ChatApp(ctk.CTk):
                             text_color=self.colors["text"],
                             border_width=1,
                             border_color=self.colors["border"],
-                            command=lambda s=suggestions[idx]: self.handle_suggestion(
-                                s
+                            command=functools.partial(
+                                self.handle_suggestion, suggestions[idx]
                             ),
                         )
                         btn.pack(
@@ -1194,12 +1241,9 @@ class ChatApp(ctk.CTk):
             self.messages_frame.clear_messages()
 
             # Add welcome message
-            self.after(
-                500,
-                lambda: self.add_message(
-                    "Olá! Sou o UCAN, seu assistente virtual. Como posso ajudar você hoje?",
-                    name,
-                ),
+            self._schedule_welcome(
+                "Olá! Sou o UCAN, seu assistente virtual. Como posso ajudar você hoje?",
+                name,
             )
 
             # Focus on message entry
@@ -1209,7 +1253,7 @@ class ChatApp(ctk.CTk):
             logger.error(f"Error starting chat with {name}: {str(e)}")
             messagebox.showerror("Erro", "Não foi possível iniciar o chat.")
 
-    def add_message(self, text, sender):
+    def add_message(self, text, sender, with_animation=True, defer=False):
         """Add a message to the conversation"""
         try:
             # Use the messages_container if it exists
@@ -1217,7 +1261,9 @@ class ChatApp(ctk.CTk):
                 self.messages_container, "add_message"
             ):
                 is_user = sender != "UCAN Assistant"
-                self.messages_container.add_message(text, is_user=is_user)
+                self.messages_container.add_message(
+                    text, is_user=is_user, with_animation=with_animation, defer=defer
+                )
             else:
                 # Fallback implementation
                 logger.warning("Messages container not available, using fallback")
@@ -1373,6 +1419,11 @@ class ChatApp(ctk.CTk):
         self.text_input.bind("<Return>", self.handle_enter)
         self.text_input.bind("<KP_Enter>", self.handle_enter)
 
+        # Shift+Enter keeps the default new line; Tk matches the modifier
+        # natively on every windowing system, so handle_enter never sees it
+        self.text_input.bind("<Shift-Return>", lambda e: None)
+        self.text_input.bind("<Shift-KP_Enter>", lambda e: None)
+
         # Ctrl+Enter for new line
         self.text_input.bind("<Control-Return>", lambda e: True)
 
@@ -1385,31 +1436,29 @@ class ChatApp(ctk.CTk):
 
     def handle_enter(self, event):
         """Trata o pressionamento da tecla Enter"""
-        if not event.state & 0x1:  # Shift não está pressionado
-            self.send_message()
-            return "break"  # Previne quebra de linha
+        self.send_message()
+        return "break"  # Previne quebra de linha
 
     def center_window(self):
         """Center the window on the screen"""
-        self.update_idletasks()
+        # Let the mainloop's own geometry pass size the window first instead
+        # of forcing a synchronous layout with update_idletasks
+        self.after_idle(self._center_window)
+
+    def _center_window(self):
+        """Center the window using its current (or requested) size"""
         width = self.winfo_width()
         height = self.winfo_height()
+
+        # Window not mapped yet, use the requested size
+        if width <= 1 or height <= 1:
+            width = self.winfo_reqwidth()
+            height = self.winfo_reqheight()
+
         x = (self.winfo_screenwidth() // 2) - (width // 2)
         y = (self.winfo_screenheight() // 2) - (height // 2)
         self.geometry(f"{width}x{height}+{x}+{y}")
 
-    def _add_placeholder(self, event=None):
-        """Add placeholder to text input"""
-        if not self.text_input.get("1.0", "end-1c").strip():
-            self.text_input.insert("1.0", "Digite sua mensagem...")
-            self.text_input.configure(text_color=self.colors["text_secondary"])
-
-    def _clear_placeholder(self, event=None):
-        """Clear placeholder from text input"""
-        if self.text_input.get("1.0", "end-1c") == "Digite sua mensagem...":
-            self.text_input.delete("1.0", "end")
-            self.text_input.configure(text_color=self.colors["text"])
-
     def _scroll_to_bottom(self):
         """Scroll messages to bottom"""
         try:
@@ -1456,6 +1505,33 @@ class ChatApp(ctk.CTk):
             "Templates", "Templates functionality will be available in a future update."
         )
 
+    def _create_pill_button(self, parent, text, command):
+        """Create an icon button inside a header pill group"""
+        button = ctk.CTkButton(
+            parent,
+            text=text,
+            width=36,
+            height=36,
+            corner_radius=0,
+            fg_color="transparent",
+            hover_color=self.colors["surface_hover"],
+            text_color=self.colors["text"],
+            command=command,
+        )
+        button.pack(side="left")
+        return button
+
+    def _create_pill_divider(self, parent):
+        """Create the thin separator between pill group buttons"""
+        divider = ctk.CTkFrame(
+            parent,
+            width=1,
+            height=20,
+            fg_color=self.colors["border"],
+        )
+        divider.pack(side="left")
+        return divider
+
     def setup_sidebar(self):
         """Creates the sidebar with projects and conversations"""
         # Sidebar container
@@ -1480,7 +1556,7 @@ class ChatApp(ctk.CTk):
         app_title = ctk.CTkLabel(
             sidebar_header,
             text="UCAN",
-            font=ctk.CTkFont(size=22, weight="bold"),
+            font=get_font(22, "bold"),
             text_color=self.colors["primary"],
         )
         app_title.pack(side="left")
@@ -1510,7 +1586,8 @@ class ChatApp(ctk.CTk):
         search_icon.pack(side="left", padx=(10, 0))
 
         self.search_var = ctk.StringVar()
-        self.search_var.trace_add("write", self._handle_search)
+        self.search_var.trace_add("write", self._schedule_search)
+        self._search_after_id = None
 
         search_entry = ctk.CTkEntry(
             search_container,
@@ -1523,30 +1600,29 @@ class ChatApp(ctk.CTk):
         )
         search_entry.pack(side="left", fill="both", expand=True, padx=10, pady=5)
 
-        # Projects section (collapsible)
+        # Projects section (collapsible), filled by refresh_sidebar_content
         self.projects_container = self._create_collapsible_section(
             sidebar_content, "Projetos", True
         )
 
-        # Load projects - this will also add the New Project button
-        self.load_projects()
-
-        # Conversations section (collapsible)
+        # Conversations section (collapsible), filled by refresh_sidebar_content
         self.conversations_container = self._create_collapsible_section(
             sidebar_content, "Conversas", True
         )
 
-        # Load conversations - this will also add the New Chat button
-        self.list_conversations()
-
-        # Settings section (collapsible)
+        # Settings section (collapsible), built the first time it is expanded
         self.settings_container = self._create_collapsible_section(
-            sidebar_content, "Settings", False
+            sidebar_content,
+            "Settings",
+            False,
+            build_content=self._build_settings_section,
         )
 
+    def _build_settings_section(self, container):
+        """Create the settings section buttons"""
         # Dark/Light theme toggle
         theme_btn = ctk.CTkButton(
-            self.settings_container,
+            container,
             text="🌓 Theme",
             fg_color=self.colors["surface_light"],
             text_color=self.colors["text"],
@@ -1559,7 +1635,7 @@ class ChatApp(ctk.CTk):
 
         # User profile button
         profile_btn = ctk.CTkButton(
-            self.settings_container,
+            container,
             text="👤 Profile",
             fg_color=self.colors["surface_light"],
             text_color=self.colors["text"],
@@ -1572,7 +1648,7 @@ class ChatApp(ctk.CTk):
 
         # Keyboard shortcuts button
         shortcuts_btn = ctk.CTkButton(
-            self.settings_container,
+            container,
             text="⌨️ Shortcuts",
             fg_color=self.colors["surface_light"],
             text_color=self.colors["text"],
@@ -1597,7 +1673,7 @@ class ChatApp(ctk.CTk):
         new_project_button = ctk.CTkButton(
             new_project_container,
             text="+ Novo Projeto",
-            font=ctk.CTkFont(size=14),
+            font=get_font(14),
             height=36,
             corner_radius=8,
             fg_color=self.colors["primary"],
@@ -1621,7 +1697,7 @@ class ChatApp(ctk.CTk):
         new_chat_button = ctk.CTkButton(
             new_chat_container,
             text="+ Nova Conversa",
-            font=ctk.CTkFont(size=14),
+            font=get_font(14),
             height=36,
             corner_radius=8,
             fg_color=self.colors["primary"],
@@ -1631,8 +1707,15 @@ class ChatApp(ctk.CTk):
         )
         new_chat_button.pack(fill="x", padx=8, pady=7)
 
-    def _create_collapsible_section(self, parent, title, expanded=True):
-        """Creates a collapsible section for the sidebar"""
+    def _create_collapsible_section(
+        self, parent, title, expanded=True, build_content=None
+    ):
+        """Creates a collapsible section for the sidebar
+
+        If ``build_content`` is given, it is called with the content frame the
+        first time the section is shown, so collapsed sections cost nothing
+        until they are opened.
+        """
         # Section container
         section = ctk.CTkFrame(
             parent,
@@ -1664,7 +1747,7 @@ class ChatApp(ctk.CTk):
         title_label = ctk.CTkLabel(
             header,
             text=title,
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=get_font(16, "bold"),
             text_color=self.colors["text"],
         )
         title_label.pack(side="left", padx=8)
@@ -1674,7 +1757,17 @@ class ChatApp(ctk.CTk):
             section,
             fg_color="transparent",
         )
+
+        built = False
+
+        def ensure_built():
+            nonlocal built
+            if build_content and not built:
+                built = True
+                build_content(content)
+
         if expanded:
+            ensure_built()
             content.pack(fill="x", pady=(8, 0))
 
         # Configure toggle button
@@ -1683,6 +1776,7 @@ class ChatApp(ctk.CTk):
             expanded = not expanded
             toggle_btn.configure(text="▼" if expanded else "▶")
             if expanded:
+                ensure_built()
                 content.pack(fill="x", pady=(8, 0))
             else:
                 content.pack_forget()
@@ -1691,20 +1785,49 @@ class ChatApp(ctk.CTk):
 
         return content
 
+    def _schedule_search(self, *args):
+        """Debounce the sidebar search so a burst of keystrokes filters once"""
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(150, self._handle_search)
+
     def _handle_search(self, *args):
         """Filter projects and conversations based on search query"""
+        self._search_after_id = None
         query = self.search_var.get().lower()
 
-        # Clear and reload projects/conversations based on search
-        for widget in self.projects_container.winfo_children():
-            widget.destroy()
-
-        for widget in self.conversations_container.winfo_children():
-            widget.destroy()
-
-        # Reload with filter
+        # Reload with filter (renders both projects and conversations)
         self.load_projects(search_query=query)
-        self.list_conversations(search_query=query)
+
+    def _filter_sidebar(self, query):
+        """Show only the sidebar rows whose search text contains the query"""
+        for label in self._sidebar_empty_labels:
+            label.destroy()
+        self._sidebar_empty_labels = []
+
+        sections = zip(
+            self._sidebar_index,
+            (self.projects_container, self.conversations_container),
+            ("Nenhum projeto encontrado", "Nenhuma conversa encontrada"),
+        )
+        for rows, container, empty_text in sections:
+            # Re-pack matches in their original order after the section buttons
+            for key, frame in rows:
+                frame.pack_forget()
+            matches = [frame for key, frame in rows if query in key]
+            for frame in matches:
+                frame.pack(fill="x", padx=8, pady=6)
+
+            # Sections without rows already show the load's empty state
+            if rows and not matches:
+                empty_label = ctk.CTkLabel(
+                    container,
+                    text=empty_text,
+                    text_color=self.colors["text_secondary"],
+                    font=get_font(13),
+                )
+                empty_label.pack(pady=20)
+                self._sidebar_empty_labels.append(empty_label)
 
     def change_language(self, lang):
         """Change the application language"""
@@ -1844,6 +1967,11 @@ class ChatApp(ctk.CTk):
 
     def load_projects(self, search_query=None):
         """Load projects into the sidebar"""
+        # Searches reuse the rows built by the last full load
+        if search_query is not None and self._sidebar_index is not None:
+            self._filter_sidebar(search_query)
+            return
+
         try:
             # Clear existing projects
             if self.projects_container and hasattr(
@@ -1860,8 +1988,26 @@ class ChatApp(ctk.CTk):
                 logger.warning("Containers not initialized yet, skipping load_projects")
                 return
 
-            # Load projects
+            # Load projects and conversations
             projects = self.project_manager.list_projects()
+            conversations = self.list_conversations()
+
+            # Clear existing conversations, keeping the "New Chat" button first
+            for widget in self.conversations_container.winfo_children():
+                widget.destroy()
+            self._add_new_chat_button()
+
+            # Rendered rows with their lowercased search text
+            project_rows = []
+            conversation_rows = []
+
+            # Looked up once instead of per row
+            surface_light = self.colors["surface_light"]
+            surface_hover = self.colors["surface_hover"]
+            text_color = self.colors["text"]
+            text_secondary = self.colors["text_secondary"]
+            title_font = get_font(15, "bold")
+            detail_font = get_font(13)
 
             if not projects:
                 # Show empty state
@@ -1869,7 +2015,7 @@ class ChatApp(ctk.CTk):
                     self.projects_container,
                     text="Nenhum projeto encontrado",
                     text_color=self.colors["text_secondary"],
-                    font=ctk.CTkFont(size=13),  # Larger font
+                    font=get_font(13),  # Larger font
                 )
                 empty_label.pack(pady=20)
             else:
@@ -1877,31 +2023,33 @@ class ChatApp(ctk.CTk):
                 for project in projects:
                     project_frame = ctk.CTkFrame(
                         self.projects_container,
-                        fg_color=self.colors["surface_light"],
+                        fg_color=surface_light,
                         corner_radius=8,
                         height=70,  # Taller frames
                     )
                     project_frame.pack(fill="x", padx=8, pady=6)  # More spacing
+                    project_rows.append((
+                        search_key(project.get("name"), project.get("description")),
+                        project_frame,
+                    ))
 
                     # Project name
                     name_label = ctk.CTkLabel(
                         project_frame,
                         text=project["name"],
-                        font=ctk.CTkFont(size=15, weight="bold"),  # Larger font
-                        text_color=self.colors["text"],
+                        font=title_font,
+                        text_color=text_color,
                     )
                     name_label.pack(anchor="w", padx=14, pady=(10, 4))  # Better padding
 
                     # Project description (truncated)
-                    desc = project["description"]
-                    if len(desc) > 35:  # Allow slightly longer descriptions
-                        desc = desc[:32] + "..."
+                    desc = truncate_text(project["description"], 35, 32)
 
                     desc_label = ctk.CTkLabel(
                         project_frame,
                         text=desc,
-                        font=ctk.CTkFont(size=13),  # Larger font
-                        text_color=self.colors["text_secondary"],
+                        font=detail_font,
+                        text_color=text_secondary,
                     )
                     desc_label.pack(anchor="w", padx=14, pady=(0, 10))  # Better padding
 
@@ -1928,22 +2076,19 @@ class ChatApp(ctk.CTk):
                         height=30,
                         corner_radius=8,
                         fg_color="transparent",
-                        hover_color=self.colors["surface_hover"],
-                        text_color=self.colors["text_secondary"],
-                        command=lambda p=project: self.show_project_panel(p),
+                        hover_color=surface_hover,
+                        text_color=text_secondary,
+                        command=functools.partial(self.show_project_panel, project),
                     )
                     settings_btn.place(relx=0.95, rely=0.5, anchor="e")
 
-            # Load conversations
-            conversations = self.list_conversations()
-
             if not conversations:
                 # Show empty state
                 empty_label = ctk.CTkLabel(
                     self.conversations_container,
                     text="Nenhuma conversa encontrada",
                     text_color=self.colors["text_secondary"],
-                    font=ctk.CTkFont(size=13),  # Larger font
+                    font=get_font(13),  # Larger font
                 )
                 empty_label.pack(pady=20)
             else:
@@ -1955,18 +2100,24 @@ class ChatApp(ctk.CTk):
 
                     conv_frame = ctk.CTkFrame(
                         self.conversations_container,
-                        fg_color=self.colors["surface_light"],
+                        fg_color=surface_light,
                         corner_radius=8,
                         height=70,  # Taller frames
                     )
                     conv_frame.pack(fill="x", padx=8, pady=6)  # More spacing
+                    conversation_rows.append((
+                        search_key(
+                            conversation.get("title"), conversation.get("preview")
+                        ),
+                        conv_frame,
+                    ))
 
                     # Conversation title
                     title_label = ctk.CTkLabel(
                         conv_frame,
                         text=conversation["title"],
-                        font=ctk.CTkFont(size=15, weight="bold"),  # Larger font
-                        text_color=self.colors["text"],
+                        font=title_font,
+                        text_color=text_color,
                     )
                     title_label.pack(
                         anchor="w", padx=14, pady=(10, 4)
@@ -1974,15 +2125,13 @@ class ChatApp(ctk.CTk):
 
                     # Preview (if available)
                     if "preview" in conversation and conversation["preview"]:
-                        preview = conversation["preview"]
-                        if len(preview) > 35:  # Allow slightly longer previews
-                            preview = preview[:32] + "..."
+                        preview = truncate_text(conversation["preview"], 35, 32)
 
                         preview_label = ctk.CTkLabel(
                             conv_frame,
                             text=preview,
-                            font=ctk.CTkFont(size=13),  # Larger font
-                            text_color=self.colors["text_secondary"],
+                            font=detail_font,
+                            text_color=text_secondary,
                         )
                         preview_label.pack(
                             anchor="w", padx=14, pady=(0, 10)
@@ -2004,6 +2153,16 @@ class ChatApp(ctk.CTk):
                         lambda e, c=conversation: self.start_chat_with(c),
                     )
 
+            # The reload destroyed any "no results" labels with the old rows
+            self._sidebar_empty_labels = []
+            self._sidebar_index = (project_rows, conversation_rows)
+
+            # Keep the active search applied across full reloads
+            if search_query is None and hasattr(self, "search_var"):
+                search_query = self.search_var.get().lower()
+            if search_query:
+                self._filter_sidebar(search_query)
+
         except Exception as e:
             logger.error(f"Error loading projects: {str(e)}")
             # Show error message in sidebar if it exists
@@ -2020,16 +2179,6 @@ class ChatApp(ctk.CTk):
     def list_conversations(self, search_query=None):
         """List all conversations"""
         try:
-            # Clear existing conversations first
-            if self.conversations_container and hasattr(
-                self.conversations_container, "winfo_children"
-            ):
-                for widget in self.conversations_container.winfo_children():
-                    widget.destroy()
-
-            # Add the "New Chat" button back first
-            self._add_new_chat_button()
-
             # First check if the conversations table exists
             cursor = self.db.conn.cursor()
             cursor.execute(
@@ -2062,6 +2211,7 @@ class ChatApp(ctk.CTk):
                 """)
 
                 self.db.conn.commit()
+                self.db.ensure_indexes()
                 return []
 
             # Check if messages table exists
@@ -2083,6 +2233,7 @@ class ChatApp(ctk.CTk):
                     )
                 """)
                 self.db.conn.commit()
+                self.db.ensure_indexes()
 
                 # Return just conversations without message count
                 cursor.execute("SELECT * FROM conversations ORDER BY updated_at DESC")
@@ -2097,14 +2248,19 @@ class ChatApp(ctk.CTk):
                     "ALTER TABLE messages ADD COLUMN conversation_id INTEGER REFERENCES conversations(id)"
                 )
                 self.db.conn.commit()
+                self.db.ensure_indexes()
 
                 # Return just conversations without messages since there wouldn't be any linked
                 cursor.execute("SELECT * FROM conversations ORDER BY updated_at DESC")
                 return [dict(row) for row in cursor.fetchall()]
 
-            # Get conversations with message count
+            # Get conversations with message count and last message in a single
+            # query, instead of one preview query per conversation
             cursor.execute("""
-                SELECT c.*, COUNT(m.id) as message_count 
+                SELECT c.*, COUNT(m.id) as message_count,
+                       (SELECT content FROM messages
+                        WHERE conversation_id = c.id
+                        ORDER BY created_at DESC LIMIT 1) as last_message
                 FROM conversations c
                 LEFT JOIN messages m ON m.conversation_id = c.id
                 GROUP BY c.id
@@ -2115,23 +2271,10 @@ class ChatApp(ctk.CTk):
             for row in cursor.fetchall():
                 conversation = dict(row)
 
-                # Get last message for preview
-                preview_cursor = self.db.conn.cursor()
-                preview_cursor.execute(
-                    """
-                    SELECT content FROM messages 
-                    WHERE conversation_id = ? 
-                    ORDER BY created_at DESC LIMIT 1
-                """,
-                    (conversation["id"],),
-                )
-
-                last_message = preview_cursor.fetchone()
-                if last_message:
-                    preview = last_message[0]
-                    conversation["preview"] = preview[:100] + (
-                        "..." if len(preview) > 100 else ""
-                    )
+                # Use the last message as preview
+                last_message = conversation.pop("last_message")
+                if last_message is not None:
+                    conversation["preview"] = truncate_text(last_message, 100)
 
                 conversations.append(conversation)
 
@@ -2145,10 +2288,8 @@ class ChatApp(ctk.CTk):
         try:
             if suggestion and isinstance(suggestion, str):
                 # Clear placeholder if visible
-                if self._placeholder_visible:
-                    self.text_input.delete("1.0", "end")
-                    self.text_input.configure(text_color=self.colors["text"])
-                    self._placeholder_visible = False
+                if self.is_placeholder:
+                    self._clear_placeholder()
 
                 # Set the suggestion as input text
                 self.text_input.delete("1.0", "end")
@@ -2176,8 +2317,13 @@ class ChatApp(ctk.CTk):
                 colors=self.colors,
                 copy_callback=self.copy_message,
             )
+            # When rebuilding, keep the container above the input area
+            pack_options = {}
+            if hasattr(self, "input_container"):
+                pack_options["before"] = self.input_container
+
             self.messages_container.pack(
-                fill="both", expand=True, padx=16, pady=(8, 16)
+                fill="both", expand=True, padx=16, pady=(8, 16), **pack_options
             )
 
         except Exception as e:
@@ -2213,7 +2359,7 @@ class ChatApp(ctk.CTk):
             project_name = ctk.CTkLabel(
                 project_header,
                 text=project["name"],
-                font=ctk.CTkFont(size=18, weight="bold"),
+                font=get_font(18, "bold"),
                 text_color=self.colors["primary"],
             )
             project_name.pack(anchor="w", padx=16, pady=(16, 4))
@@ -2221,7 +2367,7 @@ class ChatApp(ctk.CTk):
             project_desc = ctk.CTkLabel(
                 project_header,
                 text=project["description"],
-                font=ctk.CTkFont(size=14),
+                font=get_font(14),
                 text_color=self.colors["text"],
                 wraplength=800,
                 justify="left",
@@ -2245,7 +2391,9 @@ class ChatApp(ctk.CTk):
                 fg_color=self.colors["primary"],
                 hover_color=self.colors["primary_dark"],
                 text_color=self.colors["text_light"],
-                command=lambda: self.upload_file_to_project(project["id"]),
+                command=functools.partial(
+                    self.upload_file_to_project, project["id"]
+                ),
             )
             upload_btn.pack(side="left", padx=(0, 8))
 
@@ -2259,12 +2407,14 @@ class ChatApp(ctk.CTk):
                 fg_color=self.colors["primary"],
                 hover_color=self.colors["primary_dark"],
                 text_color=self.colors["text_light"],
-                command=lambda: self.start_new_project_conversation(project),
+                command=functools.partial(
+                    self.start_new_project_conversation, project
+                ),
             )
             new_convo_btn.pack(side="left", padx=4)
 
             # Add project header to container
-            self.messages_container.add_widget(project_header)
+            self.messages_container.add_widget(project_header, defer=True)
 
             if conversations:
                 # Create conversations container
@@ -2277,7 +2427,7 @@ class ChatApp(ctk.CTk):
                 convos_title = ctk.CTkLabel(
                     convos_container,
                     text="Conversas do Projeto",
-                    font=ctk.CTkFont(size=16, weight="bold"),
+                    font=get_font(16, "bold"),
                     text_color=self.colors["text"],
                 )
                 convos_title.pack(anchor="w", padx=16, pady=(16, 8))
@@ -2304,15 +2454,7 @@ class ChatApp(ctk.CTk):
                     date = conversation.get("updated_at", "")
 
                     # Format date if present
-                    date_text = ""
-                    if date:
-                        try:
-                            from datetime import datetime
-
-                            dt = datetime.strptime(date, "%Y-%m-%d %H:%M:%S")
-                            date_text = dt.strftime("%d/%m/%Y %H:%M")
-                        except:
-                            date_text = date
+                    date_text = format_timestamp(date) if date else ""
 
                     # Title with date
                     header_frame = ctk.CTkFrame(
@@ -2324,7 +2466,7 @@ class ChatApp(ctk.CTk):
                     title_label = ctk.CTkLabel(
                         header_frame,
                         text=title,
-                        font=ctk.CTkFont(size=15, weight="bold"),
+                        font=get_font(15, "bold"),
                         text_color=self.colors["text"],
                     )
                     title_label.pack(side="left")
@@ -2333,7 +2475,7 @@ class ChatApp(ctk.CTk):
                         date_label = ctk.CTkLabel(
                             header_frame,
                             text=date_text,
-                            font=ctk.CTkFont(size=12),
+                            font=get_font(12),
                             text_color=self.colors["text_secondary"],
                         )
                         date_label.pack(side="right")
@@ -2346,7 +2488,7 @@ class ChatApp(ctk.CTk):
                             text=preview,
                             wraplength=700,
                             justify="left",
-                            font=ctk.CTkFont(size=13),
+                            font=get_font(13),
                             text_color=self.colors["text_secondary"],
                         )
                         preview_label.pack(anchor="w", padx=12, pady=(4, 12), fill="x")
@@ -2370,7 +2512,7 @@ class ChatApp(ctk.CTk):
                     )
 
                 # Add conversations container to main area
-                self.messages_container.add_widget(convos_container)
+                self.messages_container.add_widget(convos_container, defer=True)
             else:
                 # Create empty state
                 empty_container = ctk.CTkFrame(
@@ -2381,7 +2523,7 @@ class ChatApp(ctk.CTk):
                 empty_label = ctk.CTkLabel(
                     empty_container,
                     text="Nenhuma conversa encontrada neste projeto",
-                    font=ctk.CTkFont(size=15),
+                    font=get_font(15),
                     text_color=self.colors["text_secondary"],
                 )
                 empty_label.pack(pady=32)
@@ -2395,11 +2537,13 @@ class ChatApp(ctk.CTk):
                     fg_color=self.colors["primary"],
                     hover_color=self.colors["primary_dark"],
                     text_color=self.colors["text_light"],
-                    command=lambda: self.start_new_project_conversation(project),
+                    command=functools.partial(
+                        self.start_new_project_conversation, project
+                    ),
                 )
                 start_btn.pack(pady=8)
 
-                self.messages_container.add_widget(empty_container)
+                self.messages_container.add_widget(empty_container, defer=True)
 
             # Show project files if any
             files = self.list_project_files(project["id"])
@@ -2414,7 +2558,7 @@ class ChatApp(ctk.CTk):
                 files_title = ctk.CTkLabel(
                     files_container,
                     text="Arquivos do Projeto",
-                    font=ctk.CTkFont(size=16, weight="bold"),
+                    font=get_font(16, "bold"),
                     text_color=self.colors["text"],
                 )
                 files_title.pack(anchor="w", padx=16, pady=(24, 8))
@@ -2462,14 +2606,14 @@ class ChatApp(ctk.CTk):
                     icon_label = ctk.CTkLabel(
                         file_row,
                         text=file_type_icon,
-                        font=ctk.CTkFont(size=18),
+                        font=get_font(18),
                     )
                     icon_label.pack(side="left", padx=(0, 8))
 
                     name_label = ctk.CTkLabel(
                         file_row,
                         text=filename,
-                        font=ctk.CTkFont(size=14),
+                        font=get_font(14),
                         text_color=self.colors["text"],
                     )
                     name_label.pack(side="left")
@@ -2491,7 +2635,7 @@ class ChatApp(ctk.CTk):
                         size_label = ctk.CTkLabel(
                             file_row,
                             text=size_text,
-                            font=ctk.CTkFont(size=12),
+                            font=get_font(12),
                             text_color=self.colors["text_secondary"],
                         )
                         size_label.pack(side="right")
@@ -2512,7 +2656,7 @@ class ChatApp(ctk.CTk):
                     )
 
                 # Add files container to main area
-                self.messages_container.add_widget(files_container)
+                self.messages_container.add_widget(files_container, defer=True)
 
             # Update status
             self.contact_status.configure(
@@ -2560,10 +2704,7 @@ class ChatApp(ctk.CTk):
 
                 last_message = preview_cursor.fetchone()
                 if last_message:
-                    preview = last_message[0]
-                    conversation["preview"] = preview[:100] + (
-                        "..." if len(preview) > 100 else ""
-                    )
+                    conversation["preview"] = truncate_text(last_message[0], 100)
 
                 conversations.append(conversation)
 
@@ -2633,20 +2774,14 @@ class ChatApp(ctk.CTk):
                 return
 
             # Get file info
-            import os
-
             filename = os.path.basename(file_path)
             file_size = os.path.getsize(file_path)
 
             # Copy file to application directory
-            import shutil
-
             app_dir = os.path.join(os.path.expanduser("~"), ".ucan", "files")
             os.makedirs(app_dir, exist_ok=True)
 
             # Create unique filename
-            import uuid
-
             unique_id = str(uuid.uuid4())
             new_filename = f"{unique_id}_{filename}"
             new_filepath = os.path.join(app_dir, new_filename)
@@ -2665,6 +2800,7 @@ class ChatApp(ctk.CTk):
             )
 
             self.db.conn.commit()
+            self.project_manager.invalidate_cache()
 
             # Refresh project view
             if self.current_project and self.current_project.get("id") == project_id:
@@ -2684,10 +2820,6 @@ class ChatApp(ctk.CTk):
     def view_project_file(self, file):
         """View a project file"""
         try:
-            import os
-            import platform
-            import subprocess
-
             filepath = file.get("filepath", "")
 
             if not os.path.exists(filepath):
@@ -2720,6 +2852,7 @@ class ChatApp(ctk.CTk):
             )
 
             self.db.conn.commit()
+            self.project_manager.invalidate_cache()
             conversation_id = cursor.lastrowid
 
             # Get the conversation
@@ -2750,30 +2883,42 @@ class ChatApp(ctk.CTk):
             )
             self.contact_status.configure(text="Carregando conversa...")
 
-            # Clear messages
-            if hasattr(self.messages_container, "clear_messages"):
-                self.messages_container.clear_messages()
+            # Reuse the view rendered the last time this conversation was open
+            if not self._switch_conversation_view(conversation["id"]):
+                # Load only the most recent page of this conversation
+                messages = self.load_conversation_messages(
+                    conversation["id"], limit=self.HISTORY_PAGE_SIZE
+                )
 
-            # Load messages for this conversation
-            messages = self.load_conversation_messages(conversation["id"])
+                if not messages:
+                    # Add system message about context
+                    self.add_message(
+                        f"👋 Iniciando conversa no contexto do projeto '{project['name']}'.\n\n"
+                        f"Este projeto contém {len(self.list_project_files(project['id']))} arquivos na base de conhecimento.",
+                        "Sistema",
+                    )
+                else:
+                    # Offer the rest of the history on demand
+                    if len(messages) == self.HISTORY_PAGE_SIZE:
+                        self._add_older_messages_button(
+                            self.messages_container, conversation["id"], messages[0]
+                        )
 
-            if not messages:
-                # Add system message about context
-                self.add_message(
-                    f"👋 Iniciando conversa no contexto do projeto '{project['name']}'.\n\n"
-                    f"Este projeto contém {len(self.list_project_files(project['id']))} arquivos na base de conhecimento.",
-                    "Sistema",
-                )
-            else:
-                # Add all messages
-                for message in messages:
-                    self.add_message(message["content"], message["sender"])
+                    # Render history in batches so long conversations don't block
+                    # the event loop
+                    self._load_history_batch(messages)
+
+            self._rendered_view = (
+                conversation["id"],
+                self.messages_container,
+                self.messages_container.generation,
+            )
 
             # Enable text input
             self.text_input.configure(state="normal")
-            if self._placeholder_visible:
+            if self.is_placeholder:
                 self.text_input.delete("1.0", "end")
-                self.text_input.insert("1.0", "Digite sua mensagem...")
+                self.text_input.insert("1.0", "Digite sua mensagem aqui...")
                 self.text_input.configure(text_color=self.colors["text_secondary"])
 
             # Update status
@@ -2788,25 +2933,201 @@ class ChatApp(ctk.CTk):
                 "Erro", f"Não foi possível iniciar a conversa: {str(e)}"
             )
 
-    def load_conversation_messages(self, conversation_id):
-        """Load messages for a conversation"""
+    def _switch_conversation_view(self, conversation_id):
+        """Prepare messages_container for a conversation
+
+        The current view is hidden and cached if it still holds a fully
+        loaded conversation. Returns True if a cached view for
+        ``conversation_id`` is now shown, False if the container is empty and
+        the history must be loaded.
+        """
+        current = self.messages_container
+        intact = (
+            self._rendered_view is not None
+            and self._rendered_view[1] is current
+            and self._rendered_view[2] == current.generation
+            and self._history_after_id is None
+        )
+        self._cancel_history_load()
+
+        # A welcome still pending belongs to the chat being left
+        self._cancel_welcome()
+
+        if intact and self._rendered_view[0] == conversation_id:
+            return True
+
+        cached = self._conversation_views.pop(conversation_id, None)
+
+        if intact:
+            # Keep the current conversation around, evicting the oldest view
+            current.pack_forget()
+            self._conversation_views[self._rendered_view[0]] = current
+            while len(self._conversation_views) > self.MAX_CACHED_VIEWS:
+                oldest = next(iter(self._conversation_views))
+                self._conversation_views.pop(oldest).destroy()
+        elif cached is not None:
+            current.destroy()
+        else:
+            current.clear_messages()
+        self._rendered_view = None
+
+        if cached is not None:
+            self.messages_container = cached
+            cached.pack(
+                fill="both",
+                expand=True,
+                padx=16,
+                pady=(8, 16),
+                before=self.input_container,
+            )
+            return True
+
+        if intact:
+            self.setup_messages_container()
+        return False
+
+    def _drop_conversation_views(self):
+        """Destroy all cached conversation views"""
+        for view in self._conversation_views.values():
+            view.destroy()
+        self._conversation_views.clear()
+
+    def _load_history_batch(self, messages, start=0, batch_size=20):
+        """Add a batch of history messages and schedule the next one"""
+        self._history_after_id = None
+        end = min(start + batch_size, len(messages))
+
+        # No animation or per-message layout flush, scroll once at the end
+        for message in messages[start:end]:
+            self.add_message(
+                message["content"],
+                message["sender"],
+                with_animation=False,
+                defer=True,
+            )
+
+        if end < len(messages):
+            self._history_after_id = self.after_idle(
+                self._load_history_batch, messages, end, batch_size
+            )
+        else:
+            self._scroll_to_bottom()
+
+    def _cancel_history_load(self):
+        """Cancel the remaining batches of a history load"""
+        if self._history_after_id is not None:
+            self.after_cancel(self._history_after_id)
+            self._history_after_id = None
+
+    def load_conversation_messages(self, conversation_id, limit=None, before=None):
+        """Load messages for a conversation
+
+        With ``limit`` only the newest ``limit`` messages are returned, older
+        than the ``before`` message if given. Messages are always in ascending
+        order.
+        """
         try:
             cursor = self.db.conn.cursor()
-            cursor.execute(
-                """
-                SELECT * FROM messages
-                WHERE conversation_id = ?
-                ORDER BY created_at ASC
-            """,
-                (conversation_id,),
-            )
+            if limit is None:
+                cursor.execute(
+                    """
+                    SELECT * FROM messages
+                    WHERE conversation_id = ?
+                    ORDER BY created_at ASC
+                """,
+                    (conversation_id,),
+                )
+                return [dict(row) for row in cursor.fetchall()]
 
-            return [dict(row) for row in cursor.fetchall()]
+            # Keyset pagination on (created_at, id), served by the
+            # conversation_id/created_at index instead of an OFFSET scan
+            if before is None:
+                cursor.execute(
+                    """
+                    SELECT * FROM messages
+                    WHERE conversation_id = ?
+                    ORDER BY created_at DESC, id DESC
+                    LIMIT ?
+                """,
+                    (conversation_id, limit),
+                )
+            else:
+                cursor.execute(
+                    """
+                    SELECT * FROM messages
+                    WHERE conversation_id = ? AND (created_at, id) < (?, ?)
+                    ORDER BY created_at DESC, id DESC
+                    LIMIT ?
+                """,
+                    (conversation_id, before["created_at"], before["id"], limit),
+                )
+
+            messages = [dict(row) for row in cursor.fetchall()]
+            messages.reverse()
+            return messages
 
         except Exception as e:
             logger.error(f"Error loading conversation messages: {str(e)}")
             return []
 
+    def _add_older_messages_button(self, container, conversation_id, oldest):
+        """Add the button that loads the page before ``oldest``
+
+        Must be called on an empty container so the button stays on top.
+        """
+        button = ctk.CTkButton(
+            container,
+            text="Carregar mensagens anteriores",
+            height=28,
+            corner_radius=14,
+            fg_color="transparent",
+            hover_color=self.colors["surface_hover"],
+            text_color=self.colors["text_secondary"],
+            font=get_font(12),
+        )
+        button.configure(
+            command=functools.partial(
+                self._load_older_messages, container, button, conversation_id, oldest
+            )
+        )
+        button.pack(pady=(8, 0))
+
+    def _load_older_messages(self, container, button, conversation_id, oldest):
+        """Prepend the page of messages before ``oldest`` to ``container``"""
+        try:
+            messages = self.load_conversation_messages(
+                conversation_id, limit=self.HISTORY_PAGE_SIZE, before=oldest
+            )
+
+            # Newest first, each one right below the button, so the page ends
+            # up in ascending order
+            for message in reversed(messages):
+                container.add_message(
+                    message["content"],
+                    is_user=message["sender"] != "UCAN Assistant",
+                    with_animation=False,
+                    after=button,
+                )
+
+            # Stop once the history is exhausted or another page would push
+            # the newest messages out of the container
+            room = container.MAX_LIVE_MESSAGES - len(container.messages)
+            if len(messages) == self.HISTORY_PAGE_SIZE and room >= len(messages):
+                button.configure(
+                    command=functools.partial(
+                        self._load_older_messages,
+                        container,
+                        button,
+                        conversation_id,
+                        messages[0],
+                    )
+                )
+            else:
+                button.destroy()
+
+        except Exception as e:
+            logger.error(f"Error loading older messages: {str(e)}")
+
     def setup_keyboard_shortcuts(self):
         """Setup keyboard shortcuts for common actions"""
         # General application shortcuts
@@ -2871,7 +3192,10 @@ class ChatApp(ctk.CTk):
         # If a dialog is open, close it
         for widget in self.winfo_children():
             if isinstance(widget, ctk.CTkToplevel) and widget.winfo_viewable():
-                widget.destroy()
+                if widget is self._translate_dialog:
+                    self._hide_translate_dialog()
+                else:
+                    widget.destroy()
                 return
 
         # Unfocus the current widget
@@ -2945,7 +3269,6 @@ class ChatApp(ctk.CTk):
         if self.projects_container and self.conversations_container:
             # Reload projects and conversations with updated colors
             self.load_projects()
-            self.list_conversations()
 
         # Force UI to update
         self.update_idletasks()
@@ -2971,12 +3294,23 @@ class ChatApp(ctk.CTk):
             messagebox.showinfo("Tradução", "Digite um texto para traduzir primeiro.")
             return
 
+        # The dialog is built once and hidden between uses
+        if self._translate_dialog is None or not self._translate_dialog.winfo_exists():
+            self._translate_dialog = self._build_translate_dialog()
+
+        self._translate_source = text
+        self._translate_dialog.deiconify()
+        self._translate_dialog.grab_set()
+        self._translate_dialog.focus_set()
+
+    def _build_translate_dialog(self):
+        """Create the language selection dialog"""
         # Create language selection dialog
         dialog = ctk.CTkToplevel(self)
         dialog.title("Traduzir Texto")
         dialog.geometry("400x300")
         dialog.transient(self)
-        dialog.grab_set()
+        dialog.protocol("WM_DELETE_WINDOW", self._hide_translate_dialog)
 
         # Center dialog
         dialog.update_idletasks()
@@ -2994,7 +3328,7 @@ class ChatApp(ctk.CTk):
         title_label = ctk.CTkLabel(
             content_frame,
             text="Traduzir para qual idioma?",
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=get_font(16, "bold"),
             text_color=self.colors["text"],
         )
         title_label.pack(pady=(0, 20))
@@ -3038,19 +3372,20 @@ class ChatApp(ctk.CTk):
             corner_radius=8,
             border_width=1,
             border_color=self.colors["border"],
-            command=dialog.destroy,
+            command=self._hide_translate_dialog,
         )
         cancel_btn.pack(side="left", padx=(0, 10))
 
         # Translate button
         def do_translate():
+            text = self._translate_source
             selected_lang = language_var.get().split(" ")[0]
             # Here we would call LLM to translate
             # For now, let's just simulate translation
             translated_text = f"[Texto traduzido para {selected_lang}]: {text}"
 
             # Close dialog
-            dialog.destroy()
+            self._hide_translate_dialog()
 
             # Add message with original text
             self.add_message(text, "Você")
@@ -3060,6 +3395,7 @@ class ChatApp(ctk.CTk):
             self._update_char_count()
 
             # Start "thinking" animation
+            self._pending_replies += 1
             self.thinking.start()
 
             # Simulate translation delay
@@ -3076,10 +3412,19 @@ class ChatApp(ctk.CTk):
         )
         translate_btn.pack(side="right")
 
+        return dialog
+
+    def _hide_translate_dialog(self):
+        """Hide the translation dialog so it can be shown again"""
+        self._translate_dialog.grab_release()
+        self._translate_dialog.withdraw()
+
     def _finish_translation(self, translated_text):
         """Complete the translation process and show result"""
-        # Stop thinking animation
-        self.thinking.stop()
+        # Stop thinking animation once no other reply is pending
+        self._pending_replies -= 1
+        if not self._pending_replies:
+            self.thinking.stop()
 
         # Add translated message
         self.add_message(translated_text, "UCAN Assistant")
@@ -3111,7 +3456,10 @@ class ChatApp(ctk.CTk):
 
     def _add_placeholder(self, event=None):
         """Add placeholder text to the input field if empty"""
-        if self.text_input.get("1.0", "end-1c").strip() == "":
+        # Compare indices instead of reading the whole buffer back
+        if not self.is_placeholder and self.text_input.compare(
+            "end-1c", "==", "1.0"
+        ):
             self.text_input.delete("1.0", "end")
             self.text_input.insert("1.0", "Digite sua mensagem aqui...")
             self.text_input.configure(text_color=self.colors["text_secondary"])
@@ -3136,6 +3484,7 @@ class ChatApp(ctk.CTk):
 
     def _process_message(self, message):
         """Process message with AI and show response"""
+        self._pending_replies -= 1
         try:
             # Simulate AI processing
             response = "I received your message: " + message
@@ -3144,8 +3493,9 @@ class ChatApp(ctk.CTk):
             # if hasattr(self, "ai_provider") and hasattr(self.ai_provider, "get_response"):
             #     response = self.ai_provider.get_response(message)
 
-            # Stop thinking animation
-            self.thinking.stop()
+            # Stop thinking animation once no other reply is pending
+            if not self._pending_replies:
+                self.thinking.stop()
 
             # Add AI response to UI
             self.add_message(response, "Assistente")
@@ -3153,13 +3503,12 @@ class ChatApp(ctk.CTk):
             # Save assistant's response to database if we have a current conversation
             if hasattr(self, "current_conversation") and self.current_conversation:
                 conversation_id = self.current_conversation["id"]
-                self.project_manager.add_message(
-                    conversation_id, response, "Assistente"
-                )
-
-                # Update conversation modified time
-                self.db.update_conversation(
-                    conversation_id, {"updated_at": datetime.now()}
+                # (ProjectManager.add_message also bumps updated_at)
+                self._queue_write(
+                    self.project_manager.add_message,
+                    conversation_id,
+                    response,
+                    "Assistente",
                 )
 
         except Exception as e:
@@ -3192,13 +3541,8 @@ class ChatApp(ctk.CTk):
     def _show_maximized(self):
         """Show the window maximized after everything is loaded"""
         try:
-            # Center the window first
-            self.center_window()
-
-            # Maximize window in a platform-independent way
-            self.update_idletasks()  # Make sure window dimensions are updated
-
-            # Get screen dimensions
+            # Get screen dimensions (no layout pass needed, the window is
+            # maximized right away so centering it first is wasted work)
             screen_width = self.winfo_screenwidth()
             screen_height = self.winfo_screenheight()
 
@@ -1,16 +1,18 @@
 import datetime
+import functools
 import logging
 import re
 import threading
 import time
 import tkinter as tk
+from collections import deque
 from tkinter import messagebox
 from typing import Callable, Dict, Optional
 
 import customtkinter as ctk
 import markdown2  # Add this import
 
-from .theme import ThemeManager
+from .theme import ThemeManager, get_font
 
 logger = logging.getLogger("UCAN")
 
@@ -55,6 +57,7 @@ class ScrollableMessageFrame(ctk.CTkScrollableFrame):
     def __init__(self, master, **kwargs):
         super().__init__(master, **kwargs)
         self.messages = []
+        self._scroll_pending = False
         self.theme_manager = ThemeManager()
         self.colors = self.theme_manager.get_colors()
 
@@ -77,7 +80,7 @@ class ScrollableMessageFrame(ctk.CTkScrollableFrame):
         start_label = ctk.CTkLabel(
             self.start_indicator,
             text="Início da Conversa",
-            font=ctk.CTkFont(size=13, weight="bold"),  # Bolder text
+            font=get_font(13, "bold"),  # Bolder text
             text_color=self.colors["text"],  # Better contrast
         )
         start_label.pack(side="left", padx=10)
@@ -101,7 +104,7 @@ class ScrollableMessageFrame(ctk.CTkScrollableFrame):
         suggestions_label = ctk.CTkLabel(
             self.suggestions_frame,
             text="Perguntas rápidas:",
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=get_font(12, "bold"),
             text_color=self.colors["text_secondary"],
         )
         suggestions_label.pack(anchor="w", padx=16)
@@ -113,31 +116,43 @@ class ScrollableMessageFrame(ctk.CTkScrollableFrame):
         )
         self.suggestions_container.pack(fill="x", padx=8, pady=8)
 
+        # Suggestion buttons are kept and reused across add_suggestions calls
+        self.suggestions_grid = None
+        self.suggestion_buttons = []
+
     def add_suggestions(self, suggestions, on_select=None):
         """Add quick suggestion buttons"""
         try:
-            # Clear existing suggestions
-            for widget in self.suggestions_container.winfo_children():
-                widget.destroy()
-
-            # Create flex layout frame
-            flex_container = ctk.CTkFrame(
-                self.suggestions_container,
-                fg_color="transparent",
-            )
-            flex_container.pack(fill="x", padx=4, pady=4)
+            # Create flex layout frame once
+            if self.suggestions_grid is None:
+                self.suggestions_grid = ctk.CTkFrame(
+                    self.suggestions_container,
+                    fg_color="transparent",
+                )
+                self.suggestions_grid.pack(fill="x", padx=4, pady=4)
 
-            # Track current row and column
-            row = 0
-            col = 0
             max_cols = 2  # Show 2 buttons per row for better layout
 
-            # Create suggestion buttons in a grid layout
-            for suggestion in suggestions:
+            # Remove buttons that are no longer needed
+            while len(self.suggestion_buttons) > len(suggestions):
+                self.suggestion_buttons.pop().destroy()
+
+            # Update existing buttons in place, only creating the missing ones
+            for i, suggestion in enumerate(suggestions):
+                command = functools.partial(
+                    self._handle_suggestion_click, suggestion, on_select
+                )
+
+                if i < len(self.suggestion_buttons):
+                    self.suggestion_buttons[i].configure(
+                        text=suggestion, command=command
+                    )
+                    continue
+
                 suggestion_btn = ctk.CTkButton(
-                    flex_container,
+                    self.suggestions_grid,
                     text=suggestion,
-                    font=ctk.CTkFont(size=13),
+                    font=get_font(13),
                     fg_color=self.colors["surface_light"],
                     text_color=self.colors["text"],
                     hover_color=self.colors["surface_hover"],
@@ -145,10 +160,9 @@ class ScrollableMessageFrame(ctk.CTkScrollableFrame):
                     width=220,  # Fixed width for alignment
                     corner_radius=12,
                     anchor="center",
-                    command=lambda s=suggestion: self._handle_suggestion_click(
-                        s, on_select
-                    ),
+                    command=command,
                 )
+                row, col = divmod(i, max_cols)
                 suggestion_btn.grid(row=row, column=col, padx=4, pady=4, sticky="ew")
 
                 # Add hover effect
@@ -161,11 +175,7 @@ class ScrollableMessageFrame(ctk.CTkScrollableFrame):
                 suggestion_btn.bind("<Enter>", on_enter)
                 suggestion_btn.bind("<Leave>", on_leave)
 
-                # Update grid position
-                col += 1
-                if col >= max_cols:
-                    col = 0
-                    row += 1
+                self.suggestion_buttons.append(suggestion_btn)
 
         except Exception as e:
             logging.error(f"Error adding suggestions: {str(e)}")
@@ -216,7 +226,7 @@ class ScrollableMessageFrame(ctk.CTkScrollableFrame):
             avatar_text = ctk.CTkLabel(
                 avatar_frame,
                 text="👤" if is_user else "🤖",
-                font=ctk.CTkFont(size=16),
+                font=get_font(16),
                 text_color=self.colors["text_light"]
                 if is_user
                 else self.colors["text"],
@@ -246,7 +256,7 @@ class ScrollableMessageFrame(ctk.CTkScrollableFrame):
             sender_label = ctk.CTkLabel(
                 info_frame,
                 text=sender_text,
-                font=ctk.CTkFont(size=12, weight="bold"),
+                font=get_font(12, "bold"),
                 text_color=self.colors["text"],
                 anchor="w" if not is_user else "e",
             )
@@ -259,7 +269,7 @@ class ScrollableMessageFrame(ctk.CTkScrollableFrame):
             time_label = ctk.CTkLabel(
                 info_frame,
                 text=current_time,
-                font=ctk.CTkFont(size=10),
+                font=get_font(10),
                 text_color=self.colors["text_secondary"],
                 anchor="w" if not is_user else "e",
             )
@@ -298,7 +308,7 @@ class ScrollableMessageFrame(ctk.CTkScrollableFrame):
                 text=message,
                 wraplength=450,  # Wider text for better readability
                 justify="left",
-                font=ctk.CTkFont(size=14),
+                font=get_font(14),
                 text_color=self.colors["text_light"]
                 if is_user
                 else self.colors["text"],
@@ -317,69 +327,22 @@ class ScrollableMessageFrame(ctk.CTkScrollableFrame):
             )
             actions_frame.pack(fill="x", pady=(4, 0))
 
-            # Action buttons with modern styling
-            actions = [
-                ("📋", lambda: self.copy_message(message), "Copiar"),
-                ("✏️", lambda: self.edit_message(message_container), "Editar"),
-                ("🗑️", lambda: self.delete_message(message_container), "Excluir"),
-            ]
-
-            action_container = ctk.CTkFrame(
-                actions_frame,
-                fg_color="transparent",
-            )
-            action_container.pack(side="right" if is_user else "left")
-
-            # Add hover-reveal action buttons
-            for icon, cmd, tooltip in actions:
-                btn = ctk.CTkButton(
-                    action_container,
-                    text=icon,
-                    width=28,
-                    height=28,
-                    corner_radius=14,
-                    fg_color="transparent",
-                    hover_color=self.colors["surface"],
-                    text_color=self.colors["text_secondary"],
-                    font=ctk.CTkFont(size=12),
-                    command=cmd,
-                )
-                btn.pack(side="left", padx=2)
-
-                # Add tooltip
-                tooltip_label = ctk.CTkLabel(
-                    self.master.master,  # Position relative to main window
-                    text=tooltip,
-                    fg_color=self.colors["surface"],
-                    corner_radius=6,
-                    text_color=self.colors["text"],
-                    font=ctk.CTkFont(size=11),
-                    padx=8,
-                    pady=4,
-                )
-
-                # Show/hide tooltip on hover
-                def on_enter(e, b=btn, t=tooltip_label):
-                    # Calculate position
-                    x = b.winfo_rootx() + b.winfo_width() // 2 - t.winfo_width() // 2
-                    y = b.winfo_rooty() - t.winfo_height() - 8
-                    t.place(x=x, y=y)
-
-                def on_leave(e, t=tooltip_label):
-                    t.place_forget()
-
-                btn.bind("<Enter>", on_enter)
-                btn.bind("<Leave>", on_leave)
-
-            # Initially hide action buttons
-            action_container.pack_forget()
+            # Action buttons and their tooltips are built on first hover,
+            # since most bubbles are never hovered
+            action_container = None
 
             # Show/hide action buttons on hover
             def show_actions(e):
+                nonlocal action_container
+                if action_container is None:
+                    action_container = self._build_message_actions(
+                        actions_frame, message, message_container
+                    )
                 action_container.pack(side="right" if is_user else "left")
 
             def hide_actions(e):
-                action_container.pack_forget()
+                if action_container is not None:
+                    action_container.pack_forget()
 
             bubble.bind("<Enter>", show_actions)
             bubble.bind("<Leave>", hide_actions)
@@ -420,6 +383,67 @@ class ScrollableMessageFrame(ctk.CTkScrollableFrame):
         except Exception as e:
             logger.error(f"Error adding message: {str(e)}")
 
+    def _build_message_actions(self, actions_frame, message, message_container):
+        """Create the hover action buttons for a message (left unpacked)"""
+        # Action buttons with modern styling
+        actions = [
+            ("📋", functools.partial(self.copy_message, message), "Copiar"),
+            ("✏️", functools.partial(self.edit_message, message_container), "Editar"),
+            (
+                "🗑️",
+                functools.partial(self.delete_message, message_container),
+                "Excluir",
+            ),
+        ]
+
+        action_container = ctk.CTkFrame(
+            actions_frame,
+            fg_color="transparent",
+        )
+
+        # Add hover-reveal action buttons
+        for icon, cmd, tooltip in actions:
+            btn = ctk.CTkButton(
+                action_container,
+                text=icon,
+                width=28,
+                height=28,
+                corner_radius=14,
+                fg_color="transparent",
+                hover_color=self.colors["surface"],
+                text_color=self.colors["text_secondary"],
+                font=get_font(12),
+                command=cmd,
+            )
+            btn.pack(side="left", padx=2)
+
+            # Add tooltip
+            tooltip_label = ctk.CTkLabel(
+                self.master.master,  # Position relative to main window
+                text=tooltip,
+                fg_color=self.colors["surface"],
+                corner_radius=6,
+                text_color=self.colors["text"],
+                font=get_font(11),
+                padx=8,
+                pady=4,
+            )
+
+            # Show/hide tooltip on hover
+            def on_enter(e, b=btn, t=tooltip_label):
+                # Calculate position
+                x = b.winfo_rootx() + b.winfo_width() // 2 - t.winfo_width() // 2
+                y = b.winfo_rooty() - t.winfo_height() - 8
+                t.place(x=x, y=y)
+
+            def on_leave(e, t=tooltip_label):
+                t.place_forget()
+
+            btn.bind("<Enter>", on_enter)
+            btn.bind("<Leave>", on_leave)
+
+        return action_container
+
     def clear_messages(self):
         """Clear all messages"""
         try:
@@ -452,7 +476,7 @@ class ScrollableMessageFrame(ctk.CTkScrollableFrame):
             toast_label = ctk.CTkLabel(
                 toast,
                 text="Mensagem copiada!",
-                font=ctk.CTkFont(size=13),
+                font=get_font(13),
                 text_color=self.colors["text_light"],
             )
             toast_label.pack(expand=True)
@@ -518,7 +542,14 @@ class ScrollableMessageFrame(ctk.CTkScrollableFrame):
             logger.error(f"Error deleting message: {str(e)}")
 
     def _scroll_to_bottom(self):
-        """Scroll to the bottom of the message frame"""
+        """Scroll to the bottom of the message frame on the next idle pass"""
+        if not self._scroll_pending:
+            self._scroll_pending = True
+            self.after_idle(self._do_scroll_bottom)
+
+    def _do_scroll_bottom(self):
+        """Flush the layout once and scroll to the bottom"""
+        self._scroll_pending = False
         try:
             # Get scrollable region to scroll to bottom
             self.update_idletasks()
@@ -611,7 +642,7 @@ class LoadingScreen(ctk.CTkToplevel):
         self.loading_label = ctk.CTkLabel(
             self,
             text="Carregando UCAN...",
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=get_font(16, "bold"),
             text_color=self.colors["text"],
         )
         self.loading_label.pack(pady=(40, 20))
@@ -629,7 +660,7 @@ class LoadingScreen(ctk.CTkToplevel):
         self.status_label = ctk.CTkLabel(
             self,
             text="Inicializando...",
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             text_color=self.colors["text_secondary"],
         )
         self.status_label.pack(pady=10)
@@ -670,7 +701,7 @@ class ThinkingIndicator(ctk.CTkFrame):
             dot = ctk.CTkLabel(
                 self,
                 text="•",
-                font=ctk.CTkFont(size=16),
+                font=get_font(16),
                 text_color=self.colors["text_secondary"],
                 width=10,
             )
@@ -678,34 +709,51 @@ class ThinkingIndicator(ctk.CTkFrame):
             self.dots.append(dot)
 
         self.is_animating = False
+        self._after_id = None
+        self._active_dot = None
 
     def start(self):
         """Start animation"""
+        # Reuse the running loop instead of scheduling a second one
+        if self.is_animating:
+            return
         self.is_animating = True
         self._animate()
 
     def stop(self):
         """Stop animation"""
         self.is_animating = False
+        if self._after_id:
+            self.after_cancel(self._after_id)
+            self._after_id = None
+
+        # Reset highlighted dot
+        if self._active_dot is not None:
+            self.dots[self._active_dot].configure(
+                text_color=self.colors["text_secondary"]
+            )
+            self._active_dot = None
 
     def _animate(self):
         """Animate dots"""
         if not self.is_animating:
             return
 
-        # Reset all dots
-        for dot in self.dots:
-            dot.configure(text_color=self.colors["text_secondary"])
-
-        # Get current time
-        now = datetime.datetime.now()
-        dot_index = (now.microsecond // 333333) % 3
+        # Highlight a new dot every third of a second, from the monotonic
+        # clock instead of building a datetime on each frame
+        dot_index = int(time.monotonic() * 3) % 3
 
-        # Highlight current dot
-        self.dots[dot_index].configure(text_color=self.colors["primary"])
+        # Only reconfigure the dots whose highlight changed
+        if dot_index != self._active_dot:
+            if self._active_dot is not None:
+                self.dots[self._active_dot].configure(
+                    text_color=self.colors["text_secondary"]
+                )
+            self.dots[dot_index].configure(text_color=self.colors["primary"])
+            self._active_dot = dot_index
 
         # Schedule next animation frame
-        self.after(100, self._animate)
+        self._after_id = self.after(100, self._animate)
 
 
 class ProjectPanel(ctk.CTkToplevel):
@@ -747,7 +795,7 @@ class ProjectPanel(ctk.CTkToplevel):
         name_label = ctk.CTkLabel(
             self,
             text="Nome do projeto:",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=get_font(14, "bold"),
         )
         name_label.pack(anchor="w", padx=20, pady=(20, 5))
 
@@ -762,7 +810,7 @@ class ProjectPanel(ctk.CTkToplevel):
         desc_label = ctk.CTkLabel(
             self,
             text="Descrição:",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=get_font(14, "bold"),
         )
         desc_label.pack(anchor="w", padx=20, pady=(0, 5))
 
@@ -777,7 +825,7 @@ class ProjectPanel(ctk.CTkToplevel):
         inst_label = ctk.CTkLabel(
             self,
             text="Instruções:",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=get_font(14, "bold"),
         )
         inst_label.pack(anchor="w", padx=20, pady=(0, 5))
 
@@ -899,6 +947,9 @@ class ProjectPanel(ctk.CTkToplevel):
 class MessagesContainer(ctk.CTkScrollableFrame):
     """Improved container for chat messages"""
 
+    # Oldest message widgets are destroyed past this count to bound relayout cost
+    MAX_LIVE_MESSAGES = 500
+
     def __init__(self, master, copy_callback=None, **kwargs):
         """Initialize messages container"""
         self.colors = kwargs.pop("colors", None)
@@ -908,11 +959,50 @@ class MessagesContainer(ctk.CTkScrollableFrame):
         self.copy_callback = copy_callback
 
         # Initialize message list
-        self.messages = []
+        self.messages = deque(maxlen=self.MAX_LIVE_MESSAGES)
+
+        # Bumped on every clear, so callers can tell their content is intact
+        self.generation = 0
+
+        # Set while a scroll to the bottom is queued for the next idle pass
+        self._scroll_pending = False
 
         # Flag to track if welcome suggestions have been added
         self.welcome_suggestions_added = False
 
+        # Set once destroy() has started tearing down the outer frame
+        self._destroying = False
+
+    def destroy(self):
+        """Destroy the container together with its scrollable frame wrapper
+
+        CTkScrollableFrame.destroy only removes the inner frame, leaving the
+        outer frame (canvas and scrollbar) packed and its global wheel/shift
+        bindings pointing at deleted commands.
+        """
+        if self._destroying:
+            # Reached again from the outer frame tearing down its children
+            super().destroy()
+            return
+        self._destroying = True
+        self._unbind_all_handlers()
+        self._parent_frame.destroy()
+
+    def _unbind_all_handlers(self):
+        """Drop this frame's handlers from the application-wide bindings"""
+        commands = set(self._tclCommands or ())
+        if not commands:
+            return
+        for sequence in self.tk.splitlist(self.tk.call("bind", "all")):
+            script = str(self.tk.call("bind", "all", sequence))
+            kept = "\n".join(
+                line
+                for line in script.split("\n")
+                if not any(command in line for command in commands)
+            )
+            if kept != script:
+                self.tk.call("bind", "all", sequence, kept)
+
     def _add_welcome_suggestions(self):
         """Add welcome suggestions chips"""
         # Don't add welcome suggestions if already added
@@ -930,7 +1020,7 @@ class MessagesContainer(ctk.CTkScrollableFrame):
         suggestions_title = ctk.CTkLabel(
             suggestions_frame,
             text="Sugestões para começar:",
-            font=ctk.CTkFont(size=15, weight="bold"),
+            font=get_font(15, "bold"),
             text_color=self.colors["text_secondary"],
         )
         suggestions_title.pack(anchor="w", pady=(0, 10))
@@ -958,7 +1048,7 @@ class MessagesContainer(ctk.CTkScrollableFrame):
             chip = ctk.CTkButton(
                 row,
                 text=suggestion,
-                font=ctk.CTkFont(size=13),
+                font=get_font(13),
                 height=32,
                 corner_radius=16,
                 fg_color=self.colors["surface"],
@@ -966,7 +1056,7 @@ class MessagesContainer(ctk.CTkScrollableFrame):
                 text_color=self.colors["text"],
                 border_width=1,
                 border_color=self.colors["border"],
-                command=lambda s=suggestion: self._handle_suggestion(s),
+                command=functools.partial(self._handle_suggestion, suggestion),
             )
             chip.pack(side="left", padx=(0, 8))
 
@@ -981,9 +1071,24 @@ class MessagesContainer(ctk.CTkScrollableFrame):
             parent.text_input.insert("1.0", suggestion)
             parent.send_message()
 
-    def add_message(self, content, is_user=False, with_animation=True):
-        """Add message to container"""
+    def add_message(
+        self, content, is_user=False, with_animation=True, defer=False, after=None
+    ):
+        """Add message to container
+
+        With ``defer=True`` no scroll is requested, so a batch of messages can
+        be added and flushed once with ``_scroll_to_bottom``. With ``after`` the
+        message is inserted below that widget as an older message, without
+        animation or scrolling.
+        """
         try:
+            # Older messages never push newer ones out of a full container
+            if after is not None:
+                if len(self.messages) == self.messages.maxlen:
+                    return None
+                with_animation = False
+                defer = True
+
             # Message frame
             message_frame = ctk.CTkFrame(
                 self,
@@ -1002,16 +1107,21 @@ class MessagesContainer(ctk.CTkScrollableFrame):
                 message_frame.configure(width=0)
 
             # Position based on sender
+            placement = {"after": after} if after is not None else {}
             if is_user:
-                message_frame.pack(fill="x", pady=8, anchor="e", padx=(64, 24))
+                message_frame.pack(
+                    fill="x", pady=8, anchor="e", padx=(64, 24), **placement
+                )
             else:
-                message_frame.pack(fill="x", pady=8, anchor="w", padx=(24, 64))
+                message_frame.pack(
+                    fill="x", pady=8, anchor="w", padx=(24, 64), **placement
+                )
 
             # Message content
             message_content = ctk.CTkLabel(
                 message_frame,
                 text=content,
-                font=ctk.CTkFont(size=14),
+                font=get_font(14),
                 wraplength=600,  # Limit width for better readability
                 justify="left",
                 anchor="w",
@@ -1023,12 +1133,21 @@ class MessagesContainer(ctk.CTkScrollableFrame):
             )
             message_content.pack(fill="both", expand=True)
 
+            # Drop the oldest message before the deque evicts it silently
+            if len(self.messages) == self.messages.maxlen:
+                oldest = self.messages.popleft()
+                oldest["frame"].destroy()
+
             # Add to messages list
-            self.messages.append({
+            entry = {
                 "frame": message_frame,
                 "content": content,
                 "is_user": is_user,
-            })
+            }
+            if after is not None:
+                self.messages.appendleft(entry)
+            else:
+                self.messages.append(entry)
 
             # Animate message appearance
             if with_animation:
@@ -1039,14 +1158,13 @@ class MessagesContainer(ctk.CTkScrollableFrame):
                 self._add_message_options(message_frame, content)
 
             # Scroll to the new message
-            self._scroll_to_bottom()
+            if not defer:
+                self._scroll_to_bottom()
 
             return message_frame
 
         except Exception as e:
-            import logging
-
-            logging.getLogger("UCAN").error(f"Error adding message: {str(e)}")
+            logger.error(f"Error adding message: {str(e)}")
             return None
 
     def _animate_message(self, frame, target_width, duration=15):
@@ -1058,15 +1176,22 @@ class MessagesContainer(ctk.CTkScrollableFrame):
             # Calculate steps
             step_size = (target_width - current_width) / duration
 
-            # Also add fade-in effect by adjusting opacity
+            # Collect the children to fade once, instead of walking the child
+            # list and re-parsing their colors on every animation step
+            fade_targets = []
             for widget in frame.winfo_children():
                 if hasattr(widget, "configure") and hasattr(widget, "cget"):
                     current_fg = widget.cget("fg_color")
                     if isinstance(current_fg, tuple) and len(current_fg) == 2:
-                        r, g, b = self._hex_to_rgb(current_fg[1])
-                        widget.configure(
-                            fg_color=(current_fg[0], f"#{r:02x}{g:02x}{b:02x}20")
-                        )
+                        fade_targets.append((
+                            widget,
+                            current_fg[0],
+                            self._hex_to_rgb(current_fg[1]),
+                        ))
+
+            # Also add fade-in effect by adjusting opacity
+            for widget, light_fg, (r, g, b) in fade_targets:
+                widget.configure(fg_color=(light_fg, f"#{r:02x}{g:02x}{b:02x}20"))
 
             def animate_step(step):
                 if step < duration:
@@ -1078,31 +1203,18 @@ class MessagesContainer(ctk.CTkScrollableFrame):
                     opacity = min(1.0, step / duration * 1.2)  # Slightly faster fade-in
 
                     # Update opacity of all child widgets
-                    for widget in frame.winfo_children():
-                        if hasattr(widget, "configure") and hasattr(widget, "cget"):
-                            current_fg = widget.cget("fg_color")
-                            if isinstance(current_fg, tuple) and len(current_fg) == 2:
-                                r, g, b = self._hex_to_rgb(current_fg[1])
-                                alpha = int(opacity * 255)
-                                widget.configure(
-                                    fg_color=(
-                                        current_fg[0],
-                                        f"#{r:02x}{g:02x}{b:02x}{alpha:02x}",
-                                    )
-                                )
+                    alpha = int(opacity * 255)
+                    for widget, light_fg, (r, g, b) in fade_targets:
+                        widget.configure(
+                            fg_color=(light_fg, f"#{r:02x}{g:02x}{b:02x}{alpha:02x}")
+                        )
 
                     # Schedule next step
                     frame.after(10, lambda: animate_step(step + 1))
                 else:
                     # Final state - restore full opacity
-                    for widget in frame.winfo_children():
-                        if hasattr(widget, "configure") and hasattr(widget, "cget"):
-                            current_fg = widget.cget("fg_color")
-                            if isinstance(current_fg, tuple) and len(current_fg) == 2:
-                                r, g, b = self._hex_to_rgb(current_fg[1])
-                                widget.configure(
-                                    fg_color=(current_fg[0], f"#{r:02x}{g:02x}{b:02x}")
-                                )
+                    for widget, light_fg, (r, g, b) in fade_targets:
+                        widget.configure(fg_color=(light_fg, f"#{r:02x}{g:02x}{b:02x}"))
 
                     frame.configure(width=target_width)
                     frame.pack_propagate(True)  # Allow resizing again
@@ -1111,9 +1223,7 @@ class MessagesContainer(ctk.CTkScrollableFrame):
             animate_step(1)
 
         except Exception as e:
-            import logging
-
-            logging.getLogger("UCAN").error(f"Error animating message: {str(e)}")
+            logger.error(f"Error animating message: {str(e)}")
 
     def _hex_to_rgb(self, hex_color):
         """Convert hex color to RGB values"""
@@ -1136,15 +1246,15 @@ class MessagesContainer(ctk.CTkScrollableFrame):
                 fg_color="transparent",
                 hover_color=self.colors["primary_dark"],
                 text_color=self.colors["text_light"],
-                font=ctk.CTkFont(size=10),
-                command=lambda: self._show_message_menu(message_frame, content),
+                font=get_font(10),
+                command=functools.partial(
+                    self._show_message_menu, message_frame, content
+                ),
             )
             options_btn.place(relx=1.0, rely=0, x=-8, y=8)
 
         except Exception as e:
-            import logging
-
-            logging.getLogger("UCAN").error(f"Error adding message options: {str(e)}")
+            logger.error(f"Error adding message options: {str(e)}")
 
     def _show_message_menu(self, message_frame, content):
         """Show message options menu"""
@@ -1160,14 +1270,17 @@ class MessagesContainer(ctk.CTkScrollableFrame):
 
             # Add menu items
             menu.add_command(
-                label="Copiar", command=lambda: self._copy_message(content)
+                label="Copiar",
+                command=functools.partial(self._copy_message, content),
             )
             menu.add_command(
-                label="Editar", command=lambda: self._edit_message(message_frame)
+                label="Editar",
+                command=functools.partial(self._edit_message, message_frame),
             )
             menu.add_separator()
             menu.add_command(
-                label="Deletar", command=lambda: self._delete_message(message_frame)
+                label="Deletar",
+                command=functools.partial(self._delete_message, message_frame),
             )
 
             # Show menu at button position
@@ -1180,9 +1293,7 @@ class MessagesContainer(ctk.CTkScrollableFrame):
                 menu.grab_release()
 
         except Exception as e:
-            import logging
-
-            logging.getLogger("UCAN").error(f"Error showing message menu: {str(e)}")
+            logger.error(f"Error showing message menu: {str(e)}")
 
     def _copy_message(self, content):
         """Copy message content"""
@@ -1203,7 +1314,7 @@ class MessagesContainer(ctk.CTkScrollableFrame):
                         fg_color=self.colors["primary_dark"],
                         border_width=0,
                         text_color=self.colors["text_light"],
-                        font=ctk.CTkFont(size=14),
+                        font=get_font(14),
                         height=100,
                     )
                     edit_box.pack(fill="both", expand=True, padx=12, pady=12)
@@ -1245,7 +1356,7 @@ class MessagesContainer(ctk.CTkScrollableFrame):
                     save_btn = ctk.CTkButton(
                         btn_frame,
                         text="Salvar",
-                        font=ctk.CTkFont(size=12),
+                        font=get_font(12),
                         width=80,
                         height=28,
                         corner_radius=14,
@@ -1260,7 +1371,7 @@ class MessagesContainer(ctk.CTkScrollableFrame):
                     cancel_btn = ctk.CTkButton(
                         btn_frame,
                         text="Cancelar",
-                        font=ctk.CTkFont(size=12),
+                        font=get_font(12),
                         width=80,
                         height=28,
                         corner_radius=14,
@@ -1274,9 +1385,7 @@ class MessagesContainer(ctk.CTkScrollableFrame):
                     break
 
         except Exception as e:
-            import logging
-
-            logging.getLogger("UCAN").error(f"Error editing message: {str(e)}")
+            logger.error(f"Error editing message: {str(e)}")
 
     def _delete_message(self, message_frame):
         """Delete message"""
@@ -1288,12 +1397,28 @@ class MessagesContainer(ctk.CTkScrollableFrame):
 
         if result:
             # Remove from messages list
-            self.messages = [
-                msg for msg in self.messages if msg["frame"] != message_frame
-            ]
+            self.messages = deque(
+                (msg for msg in self.messages if msg["frame"] != message_frame),
+                maxlen=self.MAX_LIVE_MESSAGES,
+            )
             # Remove from UI
             message_frame.destroy()
 
+    def add_widget(self, widget, defer=False):
+        """Add an arbitrary widget (headers, lists, etc.) to the container"""
+        try:
+            widget.pack(fill="x", pady=8)
+
+            if not defer:
+                self._scroll_to_bottom()
+
+        except Exception as e:
+            logger.error(f"Error adding widget: {str(e)}")
+
+    def clear_widgets(self):
+        """Clear all widgets from container"""
+        self.clear_messages()
+
     def clear_messages(self):
         """Clear all messages from container"""
         try:
@@ -1301,7 +1426,8 @@ class MessagesContainer(ctk.CTkScrollableFrame):
                 if "frame" in message and message["frame"].winfo_exists():
                     message["frame"].destroy()
 
-            self.messages = []
+            self.messages.clear()
+            self.generation += 1
 
             # Reset welcome suggestions flag
             self.welcome_suggestions_added = False
@@ -1311,19 +1437,22 @@ class MessagesContainer(ctk.CTkScrollableFrame):
                 widget.destroy()
 
         except Exception as e:
-            import logging
-
-            logging.getLogger("UCAN").error(f"Error clearing messages: {str(e)}")
+            logger.error(f"Error clearing messages: {str(e)}")
 
     def _scroll_to_bottom(self):
-        """Scroll to the bottom of the messages"""
+        """Scroll to the bottom of the messages on the next idle pass"""
+        if not self._scroll_pending:
+            self._scroll_pending = True
+            self.after_idle(self._do_scroll_bottom)
+
+    def _do_scroll_bottom(self):
+        """Flush the layout once and scroll to the bottom"""
+        self._scroll_pending = False
         try:
             self.update_idletasks()
             self._parent_canvas.yview_moveto(1.0)
         except Exception as e:
-            import logging
-
-            logging.getLogger("UCAN").error(f"Error scrolling: {str(e)}")
+            logger.error(f"Error scrolling: {str(e)}")
 
     def refresh_theme(self):
         """Refresh message theme"""
@@ -1350,6 +1479,4 @@ class MessagesContainer(ctk.CTkScrollableFrame):
                                 else self.colors["text"]
                             )
         except Exception as e:
-            import logging
-
-            logging.getLogger("UCAN").error(f"Error refreshing theme: {str(e)}")
+            logger.error(f"Error refreshing theme: {str(e)}")